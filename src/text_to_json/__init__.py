@@ -1,5 +1,5 @@
 """text-to-json: LangGraph agent that extracts structured JSON from text."""
 
-from text_to_json.api.main import extract
+from text_to_json.api.main import aextract, extract, extract_batch
 
-__all__ = ["extract"]
+__all__ = ["aextract", "extract", "extract_batch"]
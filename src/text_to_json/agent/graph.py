@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Any
+
 from langgraph.graph import END, StateGraph
 
 from text_to_json.agent.nodes import (
@@ -9,7 +12,11 @@ from text_to_json.agent.nodes import (
     is_chunk_done,
     prepare_chunk_node,
 )
-from text_to_json.agent.state import AgentState
+from text_to_json.agent.state import (
+    AgentState,
+    messages_reducer,
+    token_usage_reducer,
+)
 
 
 def create_graph() -> StateGraph:
@@ -54,3 +61,68 @@ def create_graph() -> StateGraph:
     graph.add_edge("finalize_chunk", "prepare_chunk")
 
     return graph.compile()
+
+
+@lru_cache(maxsize=1)
+def get_compiled_graph() -> StateGraph:
+    """Return the compiled extraction graph, building it on first use.
+
+    The graph topology is static, so repeated extractions reuse the same
+    compiled app instead of rebuilding and recompiling it per call.
+    """
+    return create_graph()
+
+
+def reset_graph_cache() -> None:
+    """Clear the cached compiled graph."""
+    get_compiled_graph.cache_clear()
+
+
+def _merge_updates(state: dict[str, Any], updates: dict[str, Any]) -> None:
+    """Merge node updates into *state* applying the channel reducers."""
+    for key, value in updates.items():
+        if key == "messages":
+            state["messages"] = messages_reducer(
+                state.get("messages", []), value
+            )
+        elif key == "token_usage":
+            state["token_usage"] = token_usage_reducer(
+                state.get("token_usage", {}), value
+            )
+        else:
+            state[key] = value
+
+
+def run_inline(initial_state: AgentState) -> dict[str, Any]:
+    """
+    Run the extraction loop in-process, without the LangGraph dispatcher.
+
+    Executes the same node functions with the same routing as
+    :func:`create_graph`, but as a plain Python loop — no per-transition
+    state-dict copying or superstep scheduling.  Used when no streaming
+    observability is needed; the compiled graph remains the path for
+    progress display.
+
+    Args:
+        initial_state: The initial AgentState.
+
+    Returns:
+        The final state dict.
+    """
+    state: dict[str, Any] = dict(initial_state)
+    _merge_updates(state, chunk_text_node(state))
+
+    while True:
+        _merge_updates(state, prepare_chunk_node(state))
+        if has_more_chunks(state) == "__end__":
+            break
+
+        while True:
+            _merge_updates(state, call_llm_node(state))
+            _merge_updates(state, execute_tools_node(state))
+            if is_chunk_done(state) == "finalize_chunk":
+                break
+
+        _merge_updates(state, finalize_chunk_node(state))
+
+    return state
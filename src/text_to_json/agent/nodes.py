@@ -1,10 +1,20 @@
+import copy
+import hashlib
 import json
 import logging
-from typing import Any, Literal
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, Optional
+
+import orjson
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
 
-from text_to_json.agent.prompts import build_system_prompt, build_user_message
+from text_to_json.agent.prompts import (
+    build_input_context,
+    build_static_prefix,
+    build_user_message,
+)
 from text_to_json.agent.state import AgentState
 from text_to_json.clients import get_chat_model
 from text_to_json.chunking.semantic import chunk_with_fallback
@@ -30,6 +40,139 @@ SHRINKAGE_GUARD_RATIO: float = 0.5
 DATA_LOSS_MIN_ITEMS: int = 5
 # Default number of recent LLM rounds kept when trimming context.
 DEFAULT_KEEP_LAST_N_ROUNDS: int = 2
+# Tools that only read the document/schema — safe to run concurrently.
+READ_ONLY_TOOLS: frozenset[str] = frozenset(
+    {"inspect_keys", "search_pointer", "read_value"}
+)
+
+
+def _extract_json_payload(text: str) -> str:
+    """Extract the first balanced ``{...}`` or ``[...]`` from *text*.
+
+    Tolerates stray prose before/after the JSON payload. Returns the
+    original string when no balanced container is found (the caller's
+    parse will then fail and surface the error).
+    """
+    start = -1
+    for i, ch in enumerate(text):
+        if ch in "{[":
+            start = i
+            break
+    if start == -1:
+        return text
+
+    open_ch = text[start]
+    close_ch = "}" if open_ch == "{" else "]"
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch == open_ch:
+            depth += 1
+        elif ch == close_ch:
+            depth -= 1
+            if depth == 0:
+                return text[start : i + 1]
+
+    return text
+
+
+def _loads_relaxed(text: str) -> Any:
+    """Parse JSON, recovering from stray text around the payload.
+
+    First tries a strict orjson parse; on failure, retries on the first
+    balanced JSON container found in the string. Raises
+    ``orjson.JSONDecodeError`` if both attempts fail.
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return orjson.loads(_extract_json_payload(text))
+
+
+def _dumps_result(result: Any) -> str:
+    """Serialize a tool result compactly for a ToolMessage.
+
+    orjson is markedly faster than stdlib json and the compact output
+    avoids paying whitespace tokens on every observation.
+    """
+    return orjson.dumps(
+        result, option=orjson.OPT_NON_STR_KEYS, default=str
+    ).decode()
+
+
+class LLMCache:
+    """In-memory content-addressed cache for LLM responses.
+
+    The agent runs at temperature 0, so an identical message list yields an
+    identical response — reruns over the same document (dev iteration,
+    retries, repeated corpora) can skip the API call entirely.  Entries are
+    keyed by a SHA-256 over the serialized conversation and evicted LRU.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, BaseMessage] = OrderedDict()
+
+    @staticmethod
+    def key_for(messages: list[BaseMessage]) -> str:
+        """Build a deterministic cache key from a message list."""
+        payload = json.dumps(
+            [
+                [
+                    type(m).__name__,
+                    m.content,
+                    getattr(m, "tool_calls", None) or None,
+                ]
+                for m in messages
+            ],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[BaseMessage]:
+        """Return a fresh copy of the cached response, or None on miss."""
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        self._entries.move_to_end(key)
+        # Copy with a fresh id so LangGraph's message reducer never
+        # deduplicates a reused response against an earlier one.
+        response = copy.deepcopy(cached)
+        response.id = None
+        return response
+
+    def put(self, key: str, response: BaseMessage) -> None:
+        """Store a response, evicting the least recently used entry."""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_LLM_CACHE = LLMCache()
+
+
+def reset_llm_cache() -> None:
+    """Clear the cached LLM responses."""
+    _LLM_CACHE.clear()
 
 
 def _get_truncator() -> Truncator:
@@ -46,6 +189,38 @@ def _get_truncator() -> Truncator:
     )
 
 
+def _build_system_message(
+    target_schema: Any,
+    previous_guidance: Any,
+    json_skeleton: Any,
+) -> SystemMessage:
+    """Build the per-chunk SystemMessage from the split prompt parts.
+
+    For Anthropic models the static prefix is emitted as a separate content
+    block marked with ``cache_control: ephemeral`` so the provider caches it
+    across iterations and chunks (only the small InputContext tail changes).
+    OpenAI models cache stable prefixes automatically, so they receive the
+    plain concatenated string.
+    """
+    static_prefix = build_static_prefix(target_schema is not None)
+    input_context = build_input_context(
+        target_schema, previous_guidance, json_skeleton
+    )
+
+    if get_settings().CHAT_MODEL.startswith("anthropic"):
+        return SystemMessage(
+            content=[
+                {
+                    "type": "text",
+                    "text": static_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": input_context},
+            ]
+        )
+    return SystemMessage(content=static_prefix + input_context)
+
+
 def chunk_text_node(state: AgentState) -> dict[str, Any]:
     """
     Node that divides the text into semantic chunks.
@@ -63,16 +238,20 @@ def chunk_text_node(state: AgentState) -> dict[str, Any]:
             "chunks": [],
             "current_chunk_idx": 0,
             "json_document": {},
+            "has_next": False,
             "error": "No text provided for processing.",
         }
 
-    chunks = chunk_with_fallback(text)
+    # Honor pre-computed chunks (e.g. extract_batch chunks several texts
+    # in parallel before the graphs start) instead of re-chunking.
+    chunks = state.get("chunks") or chunk_with_fallback(text)
 
     return {
         "chunks": chunks,
         "current_chunk_idx": 0,
         "json_document": {},
         "guidance": {},
+        "has_next": bool(chunks),
         "is_chunk_finalized": False,
         "iteration_count": 0,
         "max_iterations": state.get("max_iterations", 20),
@@ -103,7 +282,7 @@ def prepare_chunk_node(state: AgentState) -> dict[str, Any]:
     retry_count = state.get("chunk_retry_count", 0)
     max_retries = state.get("max_chunk_retries", 0)
 
-    system_prompt = build_system_prompt(
+    system_message = _build_system_message(
         target_schema=state.get("target_schema"),
         previous_guidance=state.get("guidance"),
         json_skeleton=state.get("json_document", {}),
@@ -135,10 +314,11 @@ def prepare_chunk_node(state: AgentState) -> dict[str, Any]:
     return {
         "current_chunk": current_chunk,
         "messages": [
-            SystemMessage(content=system_prompt),
+            system_message,
             HumanMessage(content=user_message),
         ],
-        "is_chunk_finalized": False,
+        # is_chunk_finalized is already reset by both graph predecessors
+        # (chunk_text_node and finalize_chunk_node) — no duplicate write.
         "iteration_count": 0,
     }
 
@@ -275,6 +455,15 @@ def call_llm_node(state: AgentState) -> dict[str, Any]:
     llm = get_chat_model()
     iteration = state.get("iteration_count", 0)
 
+    # ── Cache lookup: identical conversation → identical response ──
+    cache_key = _LLM_CACHE.key_for(messages)
+    cached = _LLM_CACHE.get(cache_key)
+    if cached is not None:
+        return {
+            "messages": [cached],
+            "iteration_count": iteration + 1,
+        }
+
     # ── First attempt ──
     try:
         response = llm.invoke(messages)
@@ -289,9 +478,12 @@ def call_llm_node(state: AgentState) -> dict[str, Any]:
             raise  # Can't trim further — propagate the error
 
         retry_response = llm.invoke(trimmed)
-        # trimmed starts with SystemMessage → reducer replaces all messages
+        # trimmed starts with SystemMessage → reducer replaces all messages.
+        # _trim_messages returned a fresh list, so append in place instead
+        # of copying the conversation again.
+        trimmed.append(retry_response)
         return {
-            "messages": trimmed + [retry_response],
+            "messages": trimmed,
             "iteration_count": iteration + 1,
             "token_usage": _extract_token_usage(retry_response),
         }
@@ -299,6 +491,7 @@ def call_llm_node(state: AgentState) -> dict[str, Any]:
     # ── Check for tool calls ──
     tool_calls = getattr(response, "tool_calls", None) or []
     if tool_calls:
+        _LLM_CACHE.put(cache_key, response)
         return {
             "messages": [response],
             "iteration_count": iteration + 1,
@@ -315,14 +508,67 @@ def call_llm_node(state: AgentState) -> dict[str, Any]:
         }
 
     retry_response = llm.invoke(trimmed)
-    # trimmed starts with SystemMessage → reducer replaces all messages
+    # trimmed starts with SystemMessage → reducer replaces all messages.
+    # _trim_messages returned a fresh list, so append in place instead
+    # of copying the conversation again.
+    trimmed.append(retry_response)
     return {
-        "messages": trimmed + [retry_response],
+        "messages": trimmed,
         "iteration_count": iteration + 1,
         "token_usage": _extract_token_usage(response, retry_response),
     }
 
 
+def _precompute_read_only_batch(
+    tool_calls: list[dict[str, Any]],
+    document: dict[str, Any],
+    target_schema: Optional[dict[str, Any]],
+) -> dict[int, dict[str, Any]]:
+    """Execute a pure-recon batch of tool calls concurrently.
+
+    When an LLM response bundles only read-only tools (inspect/search/
+    read), the calls have no ordering dependency — run them in a thread
+    pool and return results keyed by call index. Mutating calls
+    (apply_patches, update_guidance) are never batched; the main loop
+    applies those serially in the order the LLM requested.
+    """
+    if len(tool_calls) < 2 or not all(
+        tc["name"] in READ_ONLY_TOOLS for tc in tool_calls
+    ):
+        return {}
+    with ThreadPoolExecutor(max_workers=len(tool_calls)) as pool:
+        futures = [
+            pool.submit(
+                _safe_dispatch,
+                tc["name"],
+                tc["args"],
+                document,
+                target_schema,
+            )
+            for tc in tool_calls
+        ]
+    return {i: f.result() for i, f in enumerate(futures)}
+
+
+def _last_round_tool_contents(messages: list[BaseMessage]) -> list[str]:
+    """Return the contents of the most recent consecutive ToolMessage run."""
+    contents: list[str] = []
+    seen_tool = False
+    for msg in reversed(messages):
+        if isinstance(msg, ToolMessage):
+            seen_tool = True
+            contents.append(msg.content)
+        elif seen_tool:
+            break
+    contents.reverse()
+    return contents
+
+
+def _is_error_content(content: str) -> bool:
+    """Heuristic: does a serialized tool result represent a failure?"""
+    return '"error"' in content or '"ok":false' in content
+
+
 def execute_tools_node(state: AgentState) -> dict[str, Any]:
     """
     Node that executes the tool calls from the LLM response.
@@ -364,59 +610,59 @@ def execute_tools_node(state: AgentState) -> dict[str, Any]:
     settings = get_settings()
     truncator = _get_truncator()
 
-    for tc in tool_calls:
+    precomputed = _precompute_read_only_batch(
+        tool_calls, new_document, target_schema
+    )
+
+    for idx, tc in enumerate(tool_calls):
         name = tc["name"]
         args = tc["args"]
         call_id = tc["id"]
 
-        try:
-            result = _dispatch_tool(
-                name, args, new_document, target_schema
-            )
-
-            # Handle side effects
-            if name == "apply_patches":
-                if result.get("ok"):
-                    candidate = result.get("finalDoc", new_document)
-                    # Post-patch shrinkage guard: reject if document
-                    # lost significant content after the patch
-                    old_count = _count_nested_items(new_document)
-                    new_count = _count_nested_items(candidate)
-                    if (
-                        old_count > SHRINKAGE_GUARD_MIN_ITEMS
-                        and new_count < old_count * SHRINKAGE_GUARD_RATIO
-                    ):
-                        result = {
-                            "ok": False,
-                            "errors": [
-                                {
-                                    "opIndex": -1,
-                                    "op": None,
-                                    "pointer": "/",
-                                    "message": (
-                                        f"SHRINKAGE GUARD: patches would reduce "
-                                        f"document from {old_count} to "
-                                        f"{new_count} values "
-                                        f"({100 - int(new_count / old_count * 100)}% data loss). "
-                                        f"This likely means you replaced a container "
-                                        f"instead of appending. Use \"/-\" to "
-                                        f"append to arrays, or update individual "
-                                        f"fields instead of replacing objects."
-                                    ),
-                                }
-                            ],
-                            "finalDoc": new_document,
-                        }
-                    else:
-                        new_document = candidate
-
-            elif name == "update_guidance":
-                new_guidance = result.get("guidance", new_guidance)
-                is_finalized = True
+        if idx in precomputed:
+            result = precomputed[idx]
+        else:
+            result = _safe_dispatch(name, args, new_document, target_schema)
+
+        # Handle side effects
+        if name == "apply_patches":
+            if result.get("ok"):
+                candidate = result.get("finalDoc", new_document)
+                # Post-patch shrinkage guard: reject if document
+                # lost significant content after the patch
+                old_count = _count_nested_items(new_document)
+                new_count = _count_nested_items(candidate)
+                if (
+                    old_count > SHRINKAGE_GUARD_MIN_ITEMS
+                    and new_count < old_count * SHRINKAGE_GUARD_RATIO
+                ):
+                    result = {
+                        "ok": False,
+                        "errors": [
+                            {
+                                "opIndex": -1,
+                                "op": None,
+                                "pointer": "/",
+                                "message": (
+                                    f"SHRINKAGE GUARD: patches would reduce "
+                                    f"document from {old_count} to "
+                                    f"{new_count} values "
+                                    f"({100 - int(new_count / old_count * 100)}% data loss). "
+                                    f"This likely means you replaced a container "
+                                    f"instead of appending. Use \"/-\" to "
+                                    f"append to arrays, or update individual "
+                                    f"fields instead of replacing objects."
+                                ),
+                            }
+                        ],
+                        "finalDoc": new_document,
+                    }
+                else:
+                    new_document = candidate
 
-        except (ValueError, KeyError, TypeError, RuntimeError) as e:
-            logger.warning("Tool '%s' raised %s: %s", name, type(e).__name__, e)
-            result = {"error": f"Tool execution error: {e}"}
+        elif name == "update_guidance" and "guidance" in result:
+            new_guidance = result.get("guidance", new_guidance)
+            is_finalized = True
 
         # Truncate read_value results to avoid blowing up context
         if name == "read_value":
@@ -425,9 +671,9 @@ def execute_tools_node(state: AgentState) -> dict[str, Any]:
             )
         elif name == "apply_patches":
             response = {k: v for k, v in result.items() if k != "finalDoc"}
-            content = json.dumps(response, ensure_ascii=False, default=str)
+            content = _dumps_result(response)
         else:
-            content = json.dumps(result, ensure_ascii=False, default=str)
+            content = _dumps_result(result)
 
         tool_messages.append(
             ToolMessage(
@@ -441,6 +687,20 @@ def execute_tools_node(state: AgentState) -> dict[str, Any]:
         "json_document": new_document,
     }
 
+    # Stuck-loop breaker: if every result failed AND the observations are
+    # byte-identical to the previous round's, the model is replaying the
+    # same failing batch — finalize instead of burning the remaining
+    # iterations on identical LLM calls.
+    if not is_finalized and tool_messages:
+        new_contents = [tm.content for tm in tool_messages]
+        if all(_is_error_content(c) for c in new_contents) and (
+            new_contents == _last_round_tool_contents(messages)
+        ):
+            logger.warning(
+                "Identical failing tool batch repeated; force-finalizing chunk"
+            )
+            updates["is_chunk_finalized"] = True
+
     if is_finalized:
         updates["guidance"] = new_guidance
         updates["is_chunk_finalized"] = True
@@ -839,6 +1099,20 @@ def _resolve_source(
     return document
 
 
+def _safe_dispatch(
+    name: str,
+    args: dict[str, Any],
+    document: dict[str, Any],
+    target_schema: Any,
+) -> dict[str, Any]:
+    """Dispatch a tool call, converting execution errors into result dicts."""
+    try:
+        return _dispatch_tool(name, args, document, target_schema)
+    except (ValueError, KeyError, TypeError, RuntimeError) as e:
+        logger.warning("Tool '%s' raised %s: %s", name, type(e).__name__, e)
+        return {"error": f"Tool execution error: {e}"}
+
+
 def _dispatch_tool(
     name: str,
     args: dict[str, Any],
@@ -915,6 +1189,29 @@ def _dispatch_tool(
                 "finalDoc": document,
             }
         patches = args["patches"]
+        # Models occasionally stringify the patches array instead of
+        # passing structured JSON; recover instead of wasting the turn.
+        if isinstance(patches, str):
+            try:
+                patches = _loads_relaxed(patches)
+            except orjson.JSONDecodeError as e:
+                return {
+                    "ok": False,
+                    "errors": [
+                        {
+                            "opIndex": -1,
+                            "op": None,
+                            "pointer": "/",
+                            "message": (
+                                f"Could not parse 'patches' as JSON: {e}. "
+                                "Pass a structured array of patch operations."
+                            ),
+                        }
+                    ],
+                    "finalDoc": document,
+                }
+        if not isinstance(patches, list):
+            patches = [patches]
         # Pre-validate common mistakes and provide prescriptive hints
         pre_errors = _pre_validate_patches(patches, document)
         if pre_errors:
@@ -994,6 +1291,7 @@ def finalize_chunk_node(state: AgentState) -> dict[str, Any]:
             max_retries,
         )
         return {
+            "has_next": True,
             "is_chunk_finalized": False,
             "chunk_retry_count": retry_count + 1,
             "error": None,
@@ -1010,6 +1308,7 @@ def finalize_chunk_node(state: AgentState) -> dict[str, Any]:
     # Normal finalization or retries exhausted: advance to next chunk
     return {
         "current_chunk_idx": current_idx + 1,
+        "has_next": current_idx + 1 < total_chunks,
         "is_chunk_finalized": False,
         "chunk_retry_count": 0,
         "error": None,
@@ -1026,13 +1325,13 @@ def has_more_chunks(state: AgentState) -> Literal["call_llm", "__end__"]:
     Returns:
         "call_llm" if there are more chunks, "__end__" if not.
     """
-    chunks = state.get("chunks", [])
-    current_idx = state.get("current_chunk_idx", 0)
-
     if state.get("error"):
         return "__end__"
 
-    if current_idx < len(chunks):
+    # Single flag maintained by chunk_text_node/finalize_chunk_node —
+    # avoids re-deriving the answer from chunks/current_chunk_idx on
+    # every transition.
+    if state.get("has_next"):
         return "call_llm"
 
     return "__end__"
@@ -1,6 +1,8 @@
-import json
+from functools import lru_cache
 from typing import Any, Optional
 
+import orjson
+
 from text_to_json.settings import get_settings
 from text_to_json.misc.truncator import Truncator, TruncatorConfig
 
@@ -19,6 +21,42 @@ def _get_truncator() -> Truncator:
     )
 
 
+def skeleton_outline(
+    value: Any, max_depth: int = 3, _depth: int = 0
+) -> Any:
+    """
+    Build a compact structural outline of the document for the prompt.
+
+    Keeps key names and array lengths but drops values, so the prompt's
+    ``<JsonSkeleton>`` block stays O(structure) instead of growing with the
+    document's content. The agent drills into actual values on demand with
+    ``inspect_keys``/``read_value``.
+
+    Args:
+        value: The document (or sub-tree) to outline.
+        max_depth: Maximum object depth before collapsing to a summary.
+
+    Returns:
+        A nested structure of key names with type/length markers.
+    """
+    if isinstance(value, dict):
+        if _depth >= max_depth:
+            return f"{{object:{len(value)} keys}}"
+        return {
+            k: skeleton_outline(v, max_depth, _depth + 1)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return f"[array:{len(value)} items]"
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    return "string"
+
+
 def _build_objectives(has_schema: bool) -> str:
     """Build the PrimaryObjectives block based on schema availability."""
     if has_schema:
@@ -112,38 +150,22 @@ def _build_constraints(has_schema: bool) -> str:
     </OperationalConstraints>"""
 
 
-def build_system_prompt(
-    target_schema: Optional[dict[str, Any]] = None,
-    previous_guidance: Optional[dict[str, Any]] = None,
-    json_skeleton: Optional[dict[str, Any]] = None,
-) -> str:
+@lru_cache(maxsize=2)
+def build_static_prefix(has_schema: bool) -> str:
     """
-    Build the system prompt for the agent.
+    Build the static portion of the system prompt (everything except the
+    ``<InputContext>`` block).
+
+    The prefix only varies with schema availability, so the two possible
+    variants are cached — chunks and iterations reuse the same string
+    instead of re-rendering tens of KB of immutable instructions.
 
     Args:
-        target_schema: Target JSON schema (optional).
-        previous_guidance: State of the previous chunk (optional).
-        json_skeleton: Current JSON document skeleton.
+        has_schema: Whether a target schema was provided.
 
     Returns:
-        The complete system prompt.
+        The static prompt prefix.
     """
-    s = get_settings()
-    truncator = _get_truncator()
-
-    schema_str = json.dumps(target_schema, indent=2) if target_schema else "null"
-    has_schema = target_schema is not None
-    guidance_str = (
-        truncator.truncate_with_limit(previous_guidance, s.TRUNCATE_GUIDANCE_LIMIT)
-        if previous_guidance
-        else "null"
-    )
-    skeleton_str = (
-        truncator.truncate_with_limit(json_skeleton, s.TRUNCATE_SKELETON_LIMIT)
-        if json_skeleton
-        else "{}"
-    )
-
     objectives_block = _build_objectives(has_schema)
     patch_rules_block = _build_patch_rules(has_schema)
     constraints_block = _build_constraints(has_schema)
@@ -199,23 +221,117 @@ def build_system_prompt(
         **Style rules:** abbreviate aggressively (flds, tbls, subs, sect, @, →, =).
         Pack maximum information into minimum characters. No filler words.
     </GuidanceProtocol>
+"""
+
 
+# Last serialized schema, keyed by object identity. The schema dict is
+# fixed for a whole extraction run but re-rendered every chunk; holding a
+# reference keeps the identity check valid for the cached entry.
+_schema_cache: Optional[tuple[Any, str]] = None
+
+
+def _serialize_schema(target_schema: dict[str, Any]) -> str:
+    """Serialize the target schema, reusing the previous render when the
+    same schema object is passed again."""
+    global _schema_cache
+    if _schema_cache is not None and _schema_cache[0] is target_schema:
+        return _schema_cache[1]
+    schema_str = orjson.dumps(target_schema, option=orjson.OPT_INDENT_2).decode()
+    _schema_cache = (target_schema, schema_str)
+    return schema_str
+
+
+def reset_schema_cache() -> None:
+    """Drop the cached schema serialization (used in tests)."""
+    global _schema_cache
+    _schema_cache = None
+
+
+# Pre-built template for the dynamic prompt tail — only the three variable
+# fields are interpolated per chunk.
+_INPUT_CONTEXT_TEMPLATE = """
     <InputContext>
         <TargetSchema>
-{schema_str}
+{schema}
         </TargetSchema>
 
         <PreviousGuidance>
-{guidance_str}
+{guidance}
         </PreviousGuidance>
 
         <JsonSkeleton>
-{skeleton_str}
+{skeleton}
         </JsonSkeleton>
     </InputContext>
 </SystemPrompt>"""
 
 
+def build_input_context(
+    target_schema: Optional[dict[str, Any]] = None,
+    previous_guidance: Optional[dict[str, Any]] = None,
+    json_skeleton: Optional[dict[str, Any]] = None,
+) -> str:
+    """
+    Build the dynamic ``<InputContext>`` tail of the system prompt.
+
+    This is the only part of the system prompt that changes between chunks
+    (schema, guidance and skeleton), so it is kept small and rebuilt per
+    chunk while the static prefix is reused.
+
+    Args:
+        target_schema: Target JSON schema (optional).
+        previous_guidance: State of the previous chunk (optional).
+        json_skeleton: Current JSON document skeleton.
+
+    Returns:
+        The ``<InputContext>`` block.
+    """
+    s = get_settings()
+    truncator = _get_truncator()
+
+    schema_str = _serialize_schema(target_schema) if target_schema else "null"
+    guidance_str = (
+        truncator.truncate_with_limit(previous_guidance, s.TRUNCATE_GUIDANCE_LIMIT)
+        if previous_guidance
+        else "null"
+    )
+    skeleton_str = (
+        truncator.truncate_with_limit(
+            skeleton_outline(json_skeleton), s.TRUNCATE_SKELETON_LIMIT
+        )
+        if json_skeleton
+        else "{}"
+    )
+
+    return _INPUT_CONTEXT_TEMPLATE.format(
+        schema=schema_str, guidance=guidance_str, skeleton=skeleton_str
+    )
+
+
+def build_system_prompt(
+    target_schema: Optional[dict[str, Any]] = None,
+    previous_guidance: Optional[dict[str, Any]] = None,
+    json_skeleton: Optional[dict[str, Any]] = None,
+) -> str:
+    """
+    Build the system prompt for the agent.
+
+    The prompt is the cached static prefix plus the per-chunk
+    ``<InputContext>`` tail.
+
+    Args:
+        target_schema: Target JSON schema (optional).
+        previous_guidance: State of the previous chunk (optional).
+        json_skeleton: Current JSON document skeleton.
+
+    Returns:
+        The complete system prompt.
+    """
+    return build_static_prefix(target_schema is not None) + build_input_context(
+        target_schema, previous_guidance, json_skeleton
+    )
+
+
 def build_user_message(text_chunk: str, chunk_index: int, total_chunks: int) -> str:
     """
     Build the user message with the text chunk.
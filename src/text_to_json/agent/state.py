@@ -77,6 +77,7 @@ class AgentState(TypedDict, total=False):
 
     messages: Annotated[list[BaseMessage], messages_reducer]
 
+    has_next: bool
     is_chunk_finalized: bool
     iteration_count: int
     max_iterations: int
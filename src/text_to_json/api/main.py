@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Optional
 
-from text_to_json.agent.graph import create_graph
+from text_to_json.agent.graph import get_compiled_graph, run_inline
+from text_to_json.chunking.semantic import chunk_with_fallback
 from text_to_json.agent.state import AgentState
-from text_to_json.clients import reset_clients_cache
-from text_to_json.settings import get_settings, reset_settings_cache
+from text_to_json.cache import get_cached_result, result_cache_key, store_result
+from text_to_json.settings import get_settings
 
 
 def _build_initial_state(
@@ -27,6 +30,7 @@ def _build_initial_state(
         "json_document": {},
         "guidance": {},
         "messages": [],
+        "has_next": False,
         "is_chunk_finalized": False,
         "iteration_count": 0,
         "chunk_retry_count": 0,
@@ -90,22 +94,132 @@ def extract(
     if max_iterations_per_chunk is None:
         max_iterations_per_chunk = settings.MAX_ITERATIONS_PER_CHUNK
 
-    app = create_graph()
+    cache_key = None
+    if settings.RESULT_CACHE_ENABLED:
+        cache_key = result_cache_key(text, schema, settings.CHAT_MODEL)
+        cached = get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+    initial_state = _build_initial_state(text, schema, max_iterations_per_chunk)
+
+    if show_progress:
+        app = get_compiled_graph()
+        final_state = _run_with_progress(
+            app, initial_state, settings.CHAT_MODEL,
+            max_iterations_per_chunk, schema,
+        )
+    else:
+        final_state = run_inline(initial_state)
+
+    result = _build_result(final_state)
+    if cache_key is not None and not result["error"]:
+        store_result(cache_key, result)
+    return result
+
+
+async def aextract(
+    text: str,
+    schema: Optional[dict[str, Any]] = None,
+    max_iterations_per_chunk: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Async variant of :func:`extract`.
+
+    Runs the graph with ``ainvoke`` so callers already inside an event
+    loop can drive several extractions concurrently (see
+    :func:`extract_batch`) instead of blocking the loop for the duration
+    of each LLM round-trip.
+
+    Args:
+        text: The input text for extraction.
+        schema: Optional target schema JSON.
+        max_iterations_per_chunk: Maximum number of iterations of the agent
+                                  by chunk before forcing finalization.
+                                  If None, uses the value from Settings.MAX_ITERATIONS_PER_CHUNK.
+
+    Returns:
+        A result dict with the same shape as :func:`extract`.
+    """
+    settings = get_settings()
+
+    if max_iterations_per_chunk is None:
+        max_iterations_per_chunk = settings.MAX_ITERATIONS_PER_CHUNK
+
+    app = get_compiled_graph()
     initial_state = _build_initial_state(text, schema, max_iterations_per_chunk)
 
-    try:
-        if show_progress:
-            final_state = _run_with_progress(
-                app, initial_state, settings.CHAT_MODEL,
-                max_iterations_per_chunk, schema,
-            )
-        else:
-            final_state = app.invoke(initial_state)
-
-        return _build_result(final_state)
-    finally:
-        reset_clients_cache()
-        reset_settings_cache()
+    final_state = await app.ainvoke(initial_state)
+    return _build_result(final_state)
+
+
+def extract_batch(
+    texts: list[str],
+    schema: Optional[dict[str, Any]] = None,
+    max_iterations_per_chunk: Optional[int] = None,
+) -> list[dict[str, Any]]:
+    """
+    Extract structured data from several texts concurrently.
+
+    Chunks inside a single text stay sequential (guidance chains between
+    them), but separate texts are independent, so their extractions are
+    dispatched in parallel against the LLM instead of waiting N full
+    round-trip sequences.
+
+    Args:
+        texts: The input texts for extraction.
+        schema: Optional target schema JSON applied to every text.
+        max_iterations_per_chunk: Maximum number of iterations of the agent
+                                  by chunk before forcing finalization.
+                                  If None, uses the value from Settings.MAX_ITERATIONS_PER_CHUNK.
+
+    Returns:
+        One result dict per input text, in input order, with the same shape
+        as :func:`extract`.
+    """
+    settings = get_settings()
+
+    if max_iterations_per_chunk is None:
+        max_iterations_per_chunk = settings.MAX_ITERATIONS_PER_CHUNK
+
+    app = get_compiled_graph()
+    initial_states = [
+        _build_initial_state(text, schema, max_iterations_per_chunk)
+        for text in texts
+    ]
+
+    # Chunking is CPU-bound (regex splitting + merge passes); with several
+    # texts it is worth fanning out across processes before the graphs
+    # start. chunk_text_node honors pre-supplied chunks.
+    if len(texts) > 1:
+        try:
+            with ProcessPoolExecutor() as pool:
+                all_chunks = list(pool.map(chunk_with_fallback, texts))
+            for initial_state, chunks in zip(initial_states, all_chunks):
+                if initial_state["text"]:
+                    initial_state["chunks"] = chunks
+        except (OSError, RuntimeError):
+            # Process pools are unavailable in some environments (e.g.
+            # restricted sandboxes); fall back to in-graph chunking.
+            pass
+
+    # Cap in-flight extractions so a large batch doesn't slam the LLM
+    # provider's rate limits all at once.
+    max_concurrent = max(1, settings.MAX_CONCURRENT_EXTRACTIONS)
+
+    async def _run_all() -> list[dict[str, Any]]:
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _run_one(state: AgentState) -> dict[str, Any]:
+            async with semaphore:
+                return await app.ainvoke(state)
+
+        return await asyncio.gather(
+            *(_run_one(state) for state in initial_states)
+        )
+
+    final_states = asyncio.run(_run_all())
+    return [_build_result(final_state) for final_state in final_states]
 
 
 def _run_with_progress(
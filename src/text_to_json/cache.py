@@ -0,0 +1,94 @@
+"""SQLite-backed result cache for repeated extractions.
+
+A full extraction costs N LLM calls per chunk; re-running the same
+``(text, schema, model)`` triple (retries, evaluation reruns, UI
+"run again") re-pays all of them. The cache keys on content hashes and
+returns the prior result dict without touching the LLM.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+from text_to_json.settings import get_settings
+
+
+def result_cache_key(
+    text: str,
+    schema: Optional[dict[str, Any]],
+    model: str,
+) -> str:
+    """Build the cache key for an extraction request.
+
+    Hashes the text and the canonical (key-sorted) schema JSON so
+    semantically identical requests map to the same entry, and includes
+    the model name so a model switch never serves stale results.
+    """
+    text_digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    schema_digest = hashlib.blake2b(
+        orjson.dumps(schema, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+    return f"{text_digest}|{schema_digest}|{model}"
+
+
+def _db_path() -> Path:
+    path = Path(get_settings().SQLITE_DB_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(_db_path())
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS result_cache ("
+        "key TEXT PRIMARY KEY, result BLOB NOT NULL)"
+    )
+    return conn
+
+
+def get_cached_result(key: str) -> Optional[dict[str, Any]]:
+    """Return the cached result dict for *key*, or None on a miss.
+
+    Results go through an orjson round-trip, so callers always get fresh
+    objects that are safe to mutate.
+    """
+    try:
+        with _connect() as conn:
+            row = conn.execute(
+                "SELECT result FROM result_cache WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    try:
+        return orjson.loads(row[0])
+    except orjson.JSONDecodeError:
+        return None
+
+
+def store_result(key: str, result: dict[str, Any]) -> None:
+    """Persist a result dict under *key* (best-effort; errors are ignored)."""
+    try:
+        payload = orjson.dumps(result)
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO result_cache (key, result) VALUES (?, ?)",
+                (key, payload),
+            )
+    except (sqlite3.Error, TypeError):
+        pass
+
+
+def clear_result_cache() -> None:
+    """Drop all cached extraction results."""
+    try:
+        with _connect() as conn:
+            conn.execute("DELETE FROM result_cache")
+    except sqlite3.Error:
+        pass
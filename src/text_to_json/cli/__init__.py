@@ -1,5 +1,6 @@
 from .main import main
 from .rich_display import (
+    ProgressDisplay,
     TokenUsage,
     console,
     create_progress_display,
@@ -12,6 +13,7 @@ from .rich_display import (
 
 __all__ = [
     "main",
+    "ProgressDisplay",
     "TokenUsage",
     "console",
     "create_progress_display",
@@ -1,9 +1,11 @@
 import argparse
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from text_to_json.cli.rich_display import console, print_json_panel
 from text_to_json.settings import get_settings
 
@@ -77,15 +79,12 @@ Examples:
     return parser
 
 
-def _read_input_text(args: argparse.Namespace) -> str:
-    """Read the input text from args (direct text or file)."""
-    if args.text:
-        return args.text
-
-    if not args.file.exists():
-        print(f"Error: File not found: {args.file}", file=sys.stderr)
-        sys.exit(1)
-    return args.file.read_text(encoding="utf-8")
+def _decode_input_bytes(raw: bytes) -> str:
+    """Decode file bytes as UTF-8 with universal newlines."""
+    text = raw.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def _read_schema(args: argparse.Namespace) -> dict[str, Any] | None:
@@ -97,8 +96,8 @@ def _read_schema(args: argparse.Namespace) -> dict[str, Any] | None:
         print(f"Error: Schema file not found: {args.schema}", file=sys.stderr)
         sys.exit(1)
     try:
-        return json.loads(args.schema.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
+        return orjson.loads(args.schema.read_bytes())
+    except orjson.JSONDecodeError as e:
         print(f"Error: Invalid schema: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -109,14 +108,16 @@ def _handle_output(
     show_progress: bool,
 ) -> None:
     """Handle the output of the extraction result."""
-    indent = 2 if args.pretty else None
-    output_json = json.dumps(
-        result["json_document"], indent=indent, ensure_ascii=False
+    # orjson writes UTF-8 bytes directly — no intermediate str + encode
+    # step on the way to the file or stdout.
+    output_bytes = orjson.dumps(
+        result["json_document"],
+        option=orjson.OPT_INDENT_2 if args.pretty else 0,
     )
 
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        args.output.write_text(output_json, encoding="utf-8")
+        args.output.write_bytes(output_bytes)
         if not args.quiet:
             if show_progress:
                 console.print(f"[green]Result saved in:[/green] {args.output}")
@@ -127,18 +128,39 @@ def _handle_output(
         if show_progress:
             print_json_panel(result["json_document"])
         else:
-            print(output_json)
+            # Write the serialized bytes straight to the byte stream —
+            # decoding to str just so print() can re-encode would copy
+            # the whole document twice.
+            sys.stdout.buffer.write(output_bytes)
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
 
 
 def main():
     """Entry point of the CLI."""
-    from text_to_json import extract
-
     parser = build_parser()
     args = parser.parse_args()
 
-    text = _read_input_text(args)
+    if args.file is not None and not args.file.exists():
+        print(f"Error: File not found: {args.file}", file=sys.stderr)
+        sys.exit(1)
+
+    # Overlap disk I/O with startup cost: large --file inputs are read in
+    # a worker thread while the heavy langchain/langgraph import chain
+    # below loads.
+    text_future = None
+    if args.file is not None:
+        read_pool = ThreadPoolExecutor(max_workers=1)
+        text_future = read_pool.submit(args.file.read_bytes)
+
+    from text_to_json import extract
+
     schema = _read_schema(args)
+    if text_future is not None:
+        text = _decode_input_bytes(text_future.result())
+        read_pool.shutdown()
+    else:
+        text = args.text
 
     show_progress = args.progress and not args.quiet
     try:
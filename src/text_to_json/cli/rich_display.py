@@ -1,6 +1,13 @@
+import queue
+import sys
+import threading
+import time
 from collections import Counter
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
 
+import orjson
 from rich import box
 from rich.console import Console
 from rich.live import Live
@@ -11,6 +18,11 @@ from rich.text import Text
 
 console = Console()
 
+# When output is piped (file, CI log), Rich still pays markup parsing
+# and layout for every panel even though it emits no ANSI. The display
+# helpers fall back to minimal plain-text lines in that case.
+_IS_TTY = console.is_terminal
+
 
 @dataclass
 class TokenUsage:
@@ -53,6 +65,23 @@ class TokenUsage:
         return d
 
 
+# Status line per graph node, shared by both table builders. Hoisted to
+# module scope so per-event updates don't rebuild the dict literal.
+_NODE_DESCRIPTIONS = {
+    "chunk_text": "Dividing text into chunks...",
+    "prepare_chunk": "Preparing chunk for processing...",
+    "call_llm": "Calling language model...",
+    "execute_tools": "Executing tools...",
+    "finalize_chunk": "Finalizing chunk...",
+    "__end__": "Processing completed!",
+}
+
+
+# Newlines flattened out of the one-line text preview in a single
+# C-level translate pass (covers \r, which the old replace missed).
+_NL_TAB = str.maketrans({"\n": " ", "\r": " "})
+
+
 def _format_token_count(n: int) -> str:
     """Format a token count with thousands separator."""
     if n >= 1_000_000:
@@ -74,15 +103,6 @@ def create_progress_display(
     token_usage: TokenUsage | None = None,
 ) -> Table:
     """Build the progress visualization table."""
-    node_descriptions = {
-        "chunk_text": "Dividing text into chunks...",
-        "prepare_chunk": "Preparing chunk for processing...",
-        "call_llm": "Calling language model...",
-        "execute_tools": "Executing tools...",
-        "finalize_chunk": "Finalizing chunk...",
-        "__end__": "Processing completed!",
-    }
-
     table = Table(
         title="[bold cyan]Robust Text-to-JSON Agent[/bold cyan]",
         box=box.ROUNDED,
@@ -93,7 +113,7 @@ def create_progress_display(
     table.add_column("Info", style="bold", width=20)
     table.add_column("Value", style="white")
 
-    status_text = node_descriptions.get(current_node, f"⏳ {current_node}")
+    status_text = _NODE_DESCRIPTIONS.get(current_node, f"⏳ {current_node}")
     table.add_row("Status", Text(status_text, style="yellow"))
 
     table.add_row("Model", Text(model_name, style="cyan"))
@@ -143,15 +163,149 @@ def create_progress_display(
         table.add_row("Tokens", "[dim]None yet[/dim]")
 
     if text_preview:
-        preview = text_preview[:60] + "..." if len(text_preview) > 60 else text_preview
-        preview = preview.replace("\n", " ")
+        preview = text_preview[:60].translate(_NL_TAB)
+        if len(text_preview) > 60:
+            preview += "..."
         table.add_row("Text", Text(preview, style="dim"))
 
     return table
 
 
+class ProgressDisplay:
+    """Progress table built once and mutated in place between renders.
+
+    Rich re-renders the renderable object on every refresh, so the Live
+    display picks up in-place edits to the ``Text`` cells the table
+    already holds. Building the skeleton a single time avoids re-parsing
+    the markup title and re-allocating the table, columns, and styled
+    cells on every stream event, which :func:`create_progress_display`
+    pays on each call.
+    """
+
+    def __init__(self, model_name: str, max_iterations: int) -> None:
+        self._max_iterations = max_iterations
+
+        self._status = Text("", style="yellow")
+        self._chunk = Text("Calculating...", style="dim")
+        self._iteration = Text("", style="green")
+        self._tools_label = Text("Tools")
+        self._tools = Text("None yet", style="dim")
+        self._tokens_label = Text("Tokens")
+        self._tokens = Text("None yet", style="dim")
+        self._preview = Text("", style="dim")
+
+        # Tools-row cache: the most_common()/join work only needs
+        # redoing when the counter's total call count or contents
+        # change. Compared by equality, since callers may hand in
+        # per-render snapshot copies of the live counter.
+        self._tools_counter: Counter | None = None
+        self._tools_total = -1
+
+        # Last-written values for the remaining mutable cells, so an
+        # update only touches the Text objects whose content changed
+        # (Text.plain assignment re-derives spans internally).
+        self._last_node: str | None = None
+        self._last_chunk = (-1, -1)
+        self._last_iteration = -1
+        self._last_preview: str | None = None
+
+        table = Table(
+            title="[bold cyan]Robust Text-to-JSON Agent[/bold cyan]",
+            box=box.ROUNDED,
+            show_header=False,
+            expand=True,
+            padding=(0, 1),
+        )
+        table.add_column("Info", style="bold", width=20)
+        table.add_column("Value", style="white")
+        table.add_row("Status", self._status)
+        table.add_row("Model", Text(model_name, style="cyan"))
+        table.add_row("Chunk", self._chunk)
+        table.add_row("Iteration", self._iteration)
+        table.add_row(self._tools_label, self._tools)
+        table.add_row(self._tokens_label, self._tokens)
+        table.add_row("Text", self._preview)
+        self.table = table
+
+    def update(
+        self,
+        current_node: str,
+        chunk_idx: int,
+        total_chunks: int,
+        iteration: int,
+        tools_used: Counter,
+        text_preview: str,
+        token_usage: TokenUsage,
+    ) -> Table:
+        """Mutate the cells to reflect the current stream state."""
+        if current_node != self._last_node:
+            self._last_node = current_node
+            self._status.plain = _NODE_DESCRIPTIONS.get(
+                current_node, f"⏳ {current_node}"
+            )
+
+        if total_chunks > 0 and (chunk_idx, total_chunks) != self._last_chunk:
+            self._last_chunk = (chunk_idx, total_chunks)
+            self._chunk.plain = f"{chunk_idx + 1} / {total_chunks}"
+            self._chunk.style = "green"
+
+        if iteration != self._last_iteration:
+            self._last_iteration = iteration
+            self._iteration.plain = f"{iteration} / {self._max_iterations}"
+            self._iteration.style = (
+                "red" if iteration >= self._max_iterations - 2 else "green"
+            )
+
+        total_calls = sum(tools_used.values()) if tools_used else 0
+        if total_calls != self._tools_total or tools_used != self._tools_counter:
+            self._tools_counter = tools_used
+            self._tools_total = total_calls
+            if tools_used:
+                tools_parts = [
+                    f"{name} ({count})"
+                    for name, count in tools_used.most_common()
+                ]
+                self._tools_label.plain = f"Tools ({total_calls})"
+                self._tools.plain = ", ".join(tools_parts)
+                self._tools.style = "magenta"
+            else:
+                self._tools_label.plain = "Tools"
+                self._tools.plain = "None yet"
+                self._tools.style = "dim"
+
+        if token_usage and token_usage.total_tokens > 0:
+            total_fmt = _format_token_count(token_usage.total_tokens)
+            input_fmt = _format_token_count(token_usage.input_tokens)
+            output_fmt = _format_token_count(token_usage.output_tokens)
+            token_text = f"{total_fmt} (in: {input_fmt} out: {output_fmt})"
+            if token_usage.cache_read_input_tokens > 0:
+                cache_fmt = _format_token_count(
+                    token_usage.cache_read_input_tokens
+                )
+                token_text += f" cache: {cache_fmt}"
+            self._tokens_label.plain = f"Tokens ({token_usage.llm_calls} calls)"
+            self._tokens.plain = token_text
+            self._tokens.style = "white"
+
+        if text_preview and text_preview is not self._last_preview:
+            self._last_preview = text_preview
+            preview = text_preview[:60].translate(_NL_TAB)
+            if len(text_preview) > 60:
+                preview += "..."
+            self._preview.plain = preview
+
+        return self.table
+
+
 def print_start_panel(model_name: str, text_len: int, has_schema: bool) -> None:
     """Print the start panel of the extraction."""
+    if not _IS_TTY:
+        print(
+            f"Starting extraction: model={model_name}, "
+            f"text={text_len} chars, "
+            f"schema={'provided' if has_schema else 'automatic inference'}"
+        )
+        return
     console.print()
     console.print(
         Panel(
@@ -171,6 +325,19 @@ def print_result_panel(
     token_usage: dict | None = None,
 ) -> None:
     """Print the success panel at the end of the extraction."""
+    if not _IS_TTY:
+        line = (
+            f"Extraction completed: chunks={total_chunks}, "
+            f"fields={num_fields}"
+        )
+        if token_usage and token_usage.get("total_tokens", 0) > 0:
+            line += (
+                f", tokens={token_usage['total_tokens']}, "
+                f"llm_calls={token_usage.get('llm_calls', 0)}"
+            )
+        print(line)
+        return
+
     lines = [
         "[bold green]Extraction completed successfully![/bold green]\n",
         f"[bold]Chunks processed:[/bold] {total_chunks}",
@@ -206,6 +373,9 @@ def print_result_panel(
 
 def print_error_panel(message: str) -> None:
     """Print the error panel."""
+    if not _IS_TTY:
+        print(f"Error: {message}")
+        return
     console.print(
         Panel(
             f"[red]{message}[/red]",
@@ -218,23 +388,74 @@ def print_error_panel(message: str) -> None:
 
 def print_json_panel(json_document: dict) -> None:
     """Print the extracted JSON in a panel with syntax highlighting."""
-    import json
+    if not _IS_TTY:
+        # Piped output gets the raw document — Pygments highlighting and
+        # panel borders are wasted on a file or CI log.
+        sys.stdout.buffer.write(
+            orjson.dumps(json_document, option=orjson.OPT_INDENT_2)
+        )
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+        return
+
+    # orjson serializes in C and never ASCII-escapes, matching the old
+    # ensure_ascii=False output while skipping stdlib json's pure-Python
+    # indent path on large documents.
+    payload = orjson.dumps(json_document, option=orjson.OPT_INDENT_2)
+    console.print(_json_syntax_panel(payload))
+
+
+@lru_cache(maxsize=4)
+def _json_syntax_panel(payload: bytes) -> Panel:
+    """Build the highlighted JSON panel, memoized on the serialized bytes.
 
+    Pygments lexing is the expensive part of printing a document;
+    debug/retry flows print the same document more than once, and
+    repeats skip the re-lex. maxsize stays small because the keys are
+    whole serialized documents.
+    """
     syntax = Syntax(
-        json.dumps(json_document, indent=2, ensure_ascii=False),
+        payload.decode("utf-8"),
         "json",
         theme="monokai",
         line_numbers=True,
     )
-    console.print(
-        Panel(syntax, title="[bold]Extracted JSON[/bold]", border_style="blue")
-    )
+    return Panel(syntax, title="[bold]Extracted JSON[/bold]", border_style="blue")
+
+
+# State keys run_live_progress carries through to the returned final state.
+_FINAL_KEYS = frozenset({"json_document", "chunks", "guidance", "error"})
+
+# State-update keys that can change anything run_live_progress displays
+# or returns. Updates carrying none of them (pure bookkeeping fields)
+# are skipped outright.
+_RELEVANT_KEYS = frozenset(
+    {
+        "chunks",
+        "current_chunk_idx",
+        "current_chunk",
+        "iteration_count",
+        "messages",
+        "json_document",
+        "guidance",
+        "error",
+    }
+)
+
+# Minimum wall-clock gap between explicit Live repaints (4 Hz) —
+# repainting faster than the eye can follow only burns CPU and terminal
+# bandwidth during event bursts.
+_MIN_RENDER_INTERVAL = 0.25
 
 
 def run_live_progress(app, initial_state: dict, model_name: str, max_iterations: int):
     """
     Run the stream of the graph with Live from Rich, updating the progress table.
     Return the final state (with json_document, chunks, guidance, error, token_usage).
+
+    The table is rebuilt at most once per stream event (not once per node
+    update within the event), and only when a displayed field actually
+    changed since the last repaint.
     """
     current_node = "chunk_text"
     total_chunks = 0
@@ -243,30 +464,82 @@ def run_live_progress(app, initial_state: dict, model_name: str, max_iterations:
     tools_used: Counter = Counter()
     current_chunk_text = ""
     token_usage = TokenUsage()
-    final_state = None
-
-    with Live(
-        create_progress_display(
-            current_node,
-            chunk_idx,
-            total_chunks,
-            iteration,
-            max_iterations,
-            tools_used,
-            current_chunk_text,
-            model_name,
-            token_usage,
-        ),
-        console=console,
-        refresh_per_second=4,
-        transient=True,
-    ) as live:
+    final_state: dict = {}
+
+    # Message objects the stream has already delivered. langgraph's
+    # add_messages reducer can re-deliver earlier messages in later
+    # updates; re-scanning them would both double-count tool calls and
+    # token usage and make the scan quadratic over a long run. Keyed on
+    # id() — the graph state keeps the objects alive for the whole run,
+    # so ids are stable.
+    seen_message_ids: set[int] = set()
+
+    if _IS_TTY:
+        display = ProgressDisplay(model_name, max_iterations)
+        live_cm = Live(
+            display.update(
+                current_node,
+                chunk_idx,
+                total_chunks,
+                iteration,
+                tools_used,
+                current_chunk_text,
+                token_usage,
+            ),
+            console=console,
+            # Repaints happen only on explicit update(refresh=True) below;
+            # a timer thread repainting an unchanged table 4x/second is
+            # pure waste once updates are coalesced behind the dirty flag.
+            auto_refresh=False,
+            transient=True,
+        )
+    else:
+        # Piped output: consume the stream without rendering anything —
+        # the progress table is ANSI-repainted in place and meaningless
+        # in a log file.
+        display = None
+        live_cm = nullcontext()
+
+    with live_cm as live:
+        # Carries over between events so a change suppressed by the
+        # render-interval throttle is still painted on a later event.
+        dirty = False
+        last_render = 0.0
+
+        # Rendering happens on a background thread so the synchronous
+        # terminal write never blocks consumption of the next stream
+        # event. The single-slot queue has drop-on-newer semantics: a
+        # snapshot that is still unpainted when a fresher one arrives is
+        # simply replaced.
+        render_queue: queue.Queue | None = None
+        render_thread: threading.Thread | None = None
+        if live is not None:
+
+            def _render_worker() -> None:
+                while True:
+                    item = render_queue.get()
+                    if item is None:
+                        return
+                    live.update(display.update(*item), refresh=True)
+
+            render_queue = queue.Queue(maxsize=1)
+            render_thread = threading.Thread(target=_render_worker, daemon=True)
+            render_thread.start()
+
         for event in app.stream(initial_state, stream_mode="updates"):
             for node_name, state_update in event.items():
-                current_node = node_name
+                if _RELEVANT_KEYS.isdisjoint(state_update):
+                    continue
+
+                if node_name != current_node:
+                    current_node = node_name
+                    dirty = True
 
                 if "chunks" in state_update and state_update["chunks"]:
-                    total_chunks = len(state_update["chunks"])
+                    new_total = len(state_update["chunks"])
+                    if new_total != total_chunks:
+                        total_chunks = new_total
+                        dirty = True
 
                 if "current_chunk_idx" in state_update:
                     new_chunk_idx = state_update["current_chunk_idx"]
@@ -274,56 +547,74 @@ def run_live_progress(app, initial_state: dict, model_name: str, max_iterations:
                         chunk_idx = new_chunk_idx
                         iteration = 0
                         tools_used = Counter()
+                        dirty = True
 
                 if "current_chunk" in state_update:
-                    current_chunk_text = state_update["current_chunk"]
+                    if state_update["current_chunk"] != current_chunk_text:
+                        current_chunk_text = state_update["current_chunk"]
+                        dirty = True
 
                 if "iteration_count" in state_update:
-                    iteration = state_update["iteration_count"]
+                    if state_update["iteration_count"] != iteration:
+                        iteration = state_update["iteration_count"]
+                        dirty = True
 
                 if "messages" in state_update:
                     for msg in state_update["messages"]:
-                        if hasattr(msg, "tool_calls") and msg.tool_calls:
-                            for tool_call in msg.tool_calls:
-                                tool_name = tool_call.get("name", "")
+                        msg_id = id(msg)
+                        if msg_id in seen_message_ids:
+                            continue
+                        seen_message_ids.add(msg_id)
+
+                        # One getattr instead of hasattr + attribute load.
+                        tool_calls = getattr(msg, "tool_calls", None)
+                        if tool_calls:
+                            for tool_call in tool_calls:
+                                tool_name = tool_call.get("name")
                                 if tool_name:
                                     tools_used[tool_name] += 1
+                                    dirty = True
 
                         usage = getattr(msg, "usage_metadata", None)
                         if usage:
                             token_usage.add(usage)
-
-                if "json_document" in state_update:
-                    if final_state is None:
-                        final_state = {}
-                    final_state["json_document"] = state_update["json_document"]
-                if "chunks" in state_update:
-                    if final_state is None:
-                        final_state = {}
-                    final_state["chunks"] = state_update["chunks"]
-                if "guidance" in state_update:
-                    if final_state is None:
-                        final_state = {}
-                    final_state["guidance"] = state_update["guidance"]
-                if "error" in state_update:
-                    if final_state is None:
-                        final_state = {}
-                    final_state["error"] = state_update["error"]
-
-                live.update(
-                    create_progress_display(
-                        current_node,
-                        chunk_idx,
-                        total_chunks,
-                        iteration,
-                        max_iterations,
-                        tools_used,
-                        current_chunk_text,
-                        model_name,
-                        token_usage,
-                    )
+                            dirty = True
+
+                for key in _FINAL_KEYS & state_update.keys():
+                    final_state[key] = state_update[key]
+
+            if live is None:
+                continue
+            now = time.monotonic()
+            if dirty and now - last_render >= _MIN_RENDER_INTERVAL:
+                # The counter is copied because the render thread walks
+                # it (most_common) while this loop keeps incrementing.
+                snapshot = (
+                    current_node,
+                    chunk_idx,
+                    total_chunks,
+                    iteration,
+                    tools_used.copy(),
+                    current_chunk_text,
+                    token_usage,
                 )
-
-    result = final_state or {}
-    result["token_usage"] = token_usage.to_dict()
-    return result
+                try:
+                    render_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                render_queue.put(snapshot)
+                dirty = False
+                last_render = now
+
+        if render_thread is not None:
+            # Drop any unpainted snapshot so the sentinel can't block,
+            # then wait for the worker to finish its last paint.
+            try:
+                render_queue.get_nowait()
+            except queue.Empty:
+                pass
+            render_queue.put(None)
+            render_thread.join(timeout=2.0)
+
+    final_state["token_usage"] = token_usage.to_dict()
+    return final_state
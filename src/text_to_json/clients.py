@@ -22,10 +22,44 @@ def get_embeddings() -> Embeddings:
     )
 
 
+# OpenAI's embeddings endpoint accepts at most 2048 inputs per request.
+_EMBED_BATCH_LIMIT = 2048
+
+
+def embed_batch(texts: list[str]) -> list[list[float]]:
+    """Embed several texts in as few API round-trips as possible.
+
+    One embedding request per text is the standard mistake — latency is
+    dominated by the HTTP round-trip, not token count. This is the single
+    entry point all embedding call sites should go through: it submits
+    the whole list at once, sliced only to respect the API's per-request
+    input limit.
+
+    Args:
+        texts: The texts to embed.
+
+    Returns:
+        One embedding vector per input text, in input order.
+    """
+    if not texts:
+        return []
+    embeddings = get_embeddings()
+    vectors: list[list[float]] = []
+    for start in range(0, len(texts), _EMBED_BATCH_LIMIT):
+        vectors.extend(
+            embeddings.embed_documents(texts[start : start + _EMBED_BATCH_LIMIT])
+        )
+    return vectors
+
+
 @lru_cache(maxsize=1)
 def get_chat_model() -> BaseChatModel:
-    """Return an instance of the chat model with tools bound for extraction."""
-    from text_to_json.tools.definitions import ALL_TOOLS
+    """Return an instance of the chat model with tools bound for extraction.
+
+    Cached so the per-turn call in call_llm_node reuses a single client
+    (and its HTTP connection pool) instead of rebuilding it per iteration.
+    """
+    from text_to_json.tools.definitions import ALL_TOOLS_OPENAI
 
     settings = get_settings()
     model = init_chat_model(
@@ -34,7 +68,7 @@ def get_chat_model() -> BaseChatModel:
         temperature=0,
         max_tokens=settings.CHAT_MAX_TOKENS,
     )
-    return model.bind_tools(ALL_TOOLS, tool_choice="required")
+    return model.bind_tools(ALL_TOOLS_OPENAI, tool_choice="required")
 
 
 def get_checkpointer() -> SqliteSaver:
@@ -11,6 +11,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     OPENAI_API_KEY: SecretStr
@@ -20,9 +21,11 @@ class Settings(BaseSettings):
     EMBEDDING_MODEL: str = "openai:text-embedding-3-small"
 
     SQLITE_DB_PATH: str = ".cache/checkpoints.db"
+    RESULT_CACHE_ENABLED: bool = True
 
     MAX_ITERATIONS_PER_CHUNK: int = 20
     MAX_CHUNK_RETRIES: int = 3
+    MAX_CONCURRENT_EXTRACTIONS: int = 4
 
     TRUNCATE_SKELETON_LIMIT: int = 6000
     TRUNCATE_GUIDANCE_LIMIT: int = 6000
@@ -37,6 +40,12 @@ class Settings(BaseSettings):
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Return the process-wide Settings singleton.
+
+    Pydantic validation (env parsing, schema build) runs once on first
+    call; every later call is a cache hit. The instance is frozen, so
+    the singleton can be shared freely across the agent loop.
+    """
     return Settings()
 
 
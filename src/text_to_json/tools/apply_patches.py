@@ -53,26 +53,24 @@ class SchemaPatchChecker:
 
     @classmethod
     def _get_at(cls, doc: Any, tokens: list[str]) -> dict[str, Any]:
+        # Innermost walk of the patch layer — every op resolves its target
+        # and parent through here. Exception-based indexing keeps the loop
+        # to one container lookup per token on the happy path.
         cur = doc
-        for t in tokens:
-            if cur is None:
-                return {"exists": False, "value": None}
-            if isinstance(cur, list):
-                if t == "-":
-                    return {"exists": False, "value": None}
-                try:
-                    idx = int(t)
-                except (ValueError, TypeError):
-                    return {"exists": False, "value": None}
-                if idx < 0 or idx >= len(cur):
-                    return {"exists": False, "value": None}
-                cur = cur[idx]
-            elif cls._is_object(cur):
-                if t not in cur:
+        try:
+            for t in tokens:
+                if isinstance(cur, dict):
+                    cur = cur[t]
+                elif isinstance(cur, list):
+                    # isdigit() rejects "-", negatives and junk in one
+                    # check, so in-range lookups pay no extra branching.
+                    if not t.isdigit():
+                        return {"exists": False, "value": None}
+                    cur = cur[int(t)]
+                else:
                     return {"exists": False, "value": None}
-                cur = cur[t]
-            else:
-                return {"exists": False, "value": None}
+        except (KeyError, IndexError, AttributeError):
+            return {"exists": False, "value": None}
         return {"exists": True, "value": cur}
 
     @classmethod
@@ -687,133 +685,161 @@ class SchemaPatchChecker:
         return [cls._resolve_ref(c, root_schema) for c in candidates]
 
     @classmethod
-    def _apply_json_patch(
-        cls, doc: Any, patch_ops: list[dict[str, Any]]
-    ) -> Any:
-        current = cls._clone(doc)
-
-        def ensure_container_for_add(
-            parent: Any, key: str, value: Any
-        ) -> Any:
-            nonlocal current
-            if parent is None:
-                return cls._clone(value)
-            if isinstance(parent, list):
-                idx = len(parent) if key == "-" else int(key)
-                if not isinstance(idx, int) or idx < 0 or idx > len(parent):
-                    raise ValueError(f"add in array: invalid index: {key}")
-                parent.insert(idx, value)
-                return current
-            if not cls._is_object(parent):
-                raise ValueError("add: parent is not object/array at path")
-            parent[key] = value
+    def _op_add(cls, current: Any, parent: Any, key: str, value: Any) -> Any:
+        if parent is None:
+            return cls._clone(value)
+        if isinstance(parent, list):
+            idx = len(parent) if key == "-" else int(key)
+            if idx < 0 or idx > len(parent):
+                raise ValueError(f"add in array: invalid index: {key}")
+            parent.insert(idx, value)
             return current
+        if not cls._is_object(parent):
+            raise ValueError("add: parent is not object/array at path")
+        parent[key] = value
+        return current
 
-        def set_value(
-            parent: Any, key: str, value: Any, op_path: str
-        ) -> Any:
-            nonlocal current
-            if parent is None:
-                return cls._clone(value)
-            if isinstance(parent, list):
-                idx = int(key)
-                if idx < 0 or idx >= len(parent):
-                    raise ValueError(
-                        f"replace failed: {op_path} does not exist"
-                    )
-                parent[idx] = value
-                return current
-            if not cls._is_object(parent):
-                raise ValueError(
-                    "replace: parent is not object/array at path"
-                )
-            if key not in parent:
+    @classmethod
+    def _op_replace(
+        cls, current: Any, parent: Any, key: str, value: Any, op_path: str
+    ) -> Any:
+        if parent is None:
+            return cls._clone(value)
+        if isinstance(parent, list):
+            idx = int(key)
+            if idx < 0 or idx >= len(parent):
                 raise ValueError(
                     f"replace failed: {op_path} does not exist"
                 )
-            parent[key] = value
+            parent[idx] = value
             return current
+        if not cls._is_object(parent):
+            raise ValueError(
+                "replace: parent is not object/array at path"
+            )
+        if key not in parent:
+            raise ValueError(
+                f"replace failed: {op_path} does not exist"
+            )
+        parent[key] = value
+        return current
 
-        def remove_value(
-            parent: Any, key: str, op_path: str
-        ) -> Any:
-            nonlocal current
-            if parent is None:
-                return None
-            if isinstance(parent, list):
-                idx = int(key)
-                if idx < 0 or idx >= len(parent):
-                    raise ValueError(
-                        f"remove failed: {op_path} does not exist"
-                    )
-                parent.pop(idx)
-                return current
-            if not cls._is_object(parent):
-                raise ValueError(
-                    "remove: parent is not object/array at path"
-                )
-            if key not in parent:
+    @classmethod
+    def _op_remove(
+        cls, current: Any, parent: Any, key: str, op_path: str
+    ) -> Any:
+        if parent is None:
+            return None
+        if isinstance(parent, list):
+            idx = int(key)
+            if idx < 0 or idx >= len(parent):
                 raise ValueError(
                     f"remove failed: {op_path} does not exist"
                 )
-            del parent[key]
+            parent.pop(idx)
             return current
+        if not cls._is_object(parent):
+            raise ValueError(
+                "remove: parent is not object/array at path"
+            )
+        if key not in parent:
+            raise ValueError(
+                f"remove failed: {op_path} does not exist"
+            )
+        del parent[key]
+        return current
+
+    @classmethod
+    def _exec_add(
+        cls, current: Any, parent: Any, key: str, tokens: list[str], op: dict[str, Any]
+    ) -> Any:
+        return cls._op_add(current, parent, key, cls._clone(op.get("value")))
+
+    @classmethod
+    def _exec_replace(
+        cls, current: Any, parent: Any, key: str, tokens: list[str], op: dict[str, Any]
+    ) -> Any:
+        return cls._op_replace(
+            current, parent, key, cls._clone(op.get("value")), op["path"]
+        )
+
+    @classmethod
+    def _exec_remove(
+        cls, current: Any, parent: Any, key: str, tokens: list[str], op: dict[str, Any]
+    ) -> Any:
+        return cls._op_remove(current, parent, key, op["path"])
+
+    @classmethod
+    def _exec_test(
+        cls, current: Any, parent: Any, key: str, tokens: list[str], op: dict[str, Any]
+    ) -> Any:
+        result = cls._get_at(current, tokens)
+        if not result["exists"]:
+            raise ValueError(
+                f"test failed: {op['path']} does not exist"
+            )
+        if not cls._deep_equal(result["value"], op.get("value")):
+            raise ValueError(
+                f"test failed: value differs at {op['path']}"
+            )
+        return current
+
+    @classmethod
+    def _exec_copy(
+        cls, current: Any, parent: Any, key: str, tokens: list[str], op: dict[str, Any]
+    ) -> Any:
+        from_tokens = cls._parse_json_pointer(op["from"])
+        src = cls._get_at(current, from_tokens)
+        if not src["exists"]:
+            raise ValueError(
+                f"copy failed: from={op['from']} does not exist"
+            )
+        return cls._op_add(current, parent, key, cls._clone(src["value"]))
+
+    @classmethod
+    def _exec_move(
+        cls, current: Any, parent: Any, key: str, tokens: list[str], op: dict[str, Any]
+    ) -> Any:
+        from_tokens = cls._parse_json_pointer(op["from"])
+        src = cls._get_at(current, from_tokens)
+        if not src["exists"]:
+            raise ValueError(
+                f"move failed: from={op['from']} does not exist"
+            )
+        from_pk = cls._get_parent_and_key(current, from_tokens)
+        current = cls._op_remove(
+            current, from_pk["parent"], from_pk["key"], op["from"]
+        )
+        # tokens was already parsed from op["path"]; the destination
+        # parent must be re-resolved after the remove (it can shift list
+        # indices), but not re-parsed.
+        dst_pk = cls._get_parent_and_key(current, tokens)
+        return cls._op_add(
+            current, dst_pk["parent"], dst_pk["key"], cls._clone(src["value"])
+        )
+
+    @classmethod
+    def _apply_json_patch(
+        cls, doc: Any, patch_ops: list[dict[str, Any]], clone: bool = True
+    ) -> Any:
+        # The validator already works on a private deep copy of the
+        # document and applies ops one at a time; cloning again here would
+        # deep-copy the whole document once per operation.  clone=False
+        # skips that and mutates *doc* directly (inserted values are still
+        # cloned below so caller-owned patch values are never aliased).
+        # The op implementations are classmethods (`_op_add` etc.) rather
+        # than closures so they are built once, not per call — the
+        # validator calls this function once per operation.
+        current = cls._clone(doc) if clone else doc
 
         for op in patch_ops:
             tokens = cls._parse_json_pointer(op["path"])
             pk = cls._get_parent_and_key(current, tokens)
-            parent, key = pk["parent"], pk["key"]
 
-            op_name = op["op"]
-
-            if op_name == "add":
-                current = ensure_container_for_add(
-                    parent, key, cls._clone(op.get("value"))
-                )
-            elif op_name == "replace":
-                current = set_value(
-                    parent, key, cls._clone(op.get("value")), op["path"]
-                )
-            elif op_name == "remove":
-                current = remove_value(parent, key, op["path"])
-            elif op_name == "test":
-                result = cls._get_at(current, tokens)
-                if not result["exists"]:
-                    raise ValueError(
-                        f"test failed: {op['path']} does not exist"
-                    )
-                if not cls._deep_equal(result["value"], op.get("value")):
-                    raise ValueError(
-                        f"test failed: value differs at {op['path']}"
-                    )
-            elif op_name == "copy":
-                from_tokens = cls._parse_json_pointer(op["from"])
-                src = cls._get_at(current, from_tokens)
-                if not src["exists"]:
-                    raise ValueError(
-                        f"copy failed: from={op['from']} does not exist"
-                    )
-                current = ensure_container_for_add(
-                    parent, key, cls._clone(src["value"])
-                )
-            elif op_name == "move":
-                from_tokens = cls._parse_json_pointer(op["from"])
-                src = cls._get_at(current, from_tokens)
-                if not src["exists"]:
-                    raise ValueError(
-                        f"move failed: from={op['from']} does not exist"
-                    )
-                from_pk = cls._get_parent_and_key(current, from_tokens)
-                current = remove_value(
-                    from_pk["parent"], from_pk["key"], op["from"]
-                )
-                dst_tokens = cls._parse_json_pointer(op["path"])
-                dst_pk = cls._get_parent_and_key(current, dst_tokens)
-                current = ensure_container_for_add(
-                    dst_pk["parent"], dst_pk["key"], cls._clone(src["value"])
-                )
-            else:
-                raise ValueError(f"Operation not supported: {op_name}")
+            handler = _OPS.get(op["op"])
+            if handler is None:
+                raise ValueError(f"Operation not supported: {op['op']}")
+            current = handler(cls, current, pk["parent"], pk["key"], tokens, op)
 
         return current
 
@@ -923,7 +949,7 @@ class SchemaPatchChecker:
                     if op["op"] == "add":
                         tokens = cls._parse_json_pointer(op["path"])
                         doc = ensure_parent_chain_for_add(doc, tokens)
-                    doc = cls._apply_json_patch(doc, [op])
+                    doc = cls._apply_json_patch(doc, [op], clone=False)
                 except Exception as e:
                     add_err(i, op, op["path"], f"failed to apply patch: {e}")
 
@@ -1151,7 +1177,7 @@ class SchemaPatchChecker:
 
             # apply the patch
             try:
-                doc = cls._apply_json_patch(doc, [op])
+                doc = cls._apply_json_patch(doc, [op], clone=False)
             except Exception as e:
                 add_err(i, op, op["path"], f"failed to apply patch: {e}")
                 continue
@@ -1214,6 +1240,19 @@ class SchemaPatchChecker:
         return key in req
 
 
+# RFC 6902 op dispatch for _apply_json_patch — one dict lookup per op
+# instead of an if/elif ladder. Values are the underlying functions, so
+# handlers are called with cls explicitly.
+_OPS = {
+    "add": SchemaPatchChecker._exec_add.__func__,
+    "replace": SchemaPatchChecker._exec_replace.__func__,
+    "remove": SchemaPatchChecker._exec_remove.__func__,
+    "test": SchemaPatchChecker._exec_test.__func__,
+    "copy": SchemaPatchChecker._exec_copy.__func__,
+    "move": SchemaPatchChecker._exec_move.__func__,
+}
+
+
 def apply_patches(
     document: dict[str, Any],
     patches: list[dict[str, Any]],
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Literal
 
 from langchain_core.tools import tool
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from pydantic import BaseModel, Field
 
 
@@ -276,3 +277,9 @@ ALL_TOOLS = [
     apply_patches_tool,
     update_guidance_tool,
 ]
+
+# Tool schemas pre-converted to the OpenAI function-calling format once
+# at import. bind_tools accepts these dicts as-is, so rebinding the chat
+# model (e.g. after reset_clients_cache) skips re-deriving JSON schema
+# from the pydantic models.
+ALL_TOOLS_OPENAI = [convert_to_openai_tool(t) for t in ALL_TOOLS]
@@ -1,14 +1,48 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Optional
 
 from text_to_json.tools.json_pointer import (
+    decode_pointer_token,
     decode_pointer_token_with_url,
     encode_pointer_token,
 )
 
 
+@lru_cache(maxsize=4096)
+def _parse_pointer_tokens(pointer: str, try_url_decode: bool) -> tuple[str, ...]:
+    """Split and decode an inspect pointer, memoized per (path, mode).
+
+    The agent re-inspects the same small set of pointers across
+    iterations; caching skips the per-token decode on repeats.
+    """
+    if pointer == "" or pointer == "/":
+        return ()
+    if not pointer.startswith("/"):
+        pointer = "/" + pointer
+    raw_tokens = pointer.split("/")[1:]
+    if try_url_decode:
+        return tuple(decode_pointer_token_with_url(t) for t in raw_tokens)
+    return tuple(decode_pointer_token(t) for t in raw_tokens)
+
+
+# Exact-type → JSON type name dispatch. `_safe_type` runs per node in the
+# summarize walk; the dict lookup covers the common case in O(1) and the
+# isinstance ladder remains as the subclass fallback.
+_JSON_TYPE_NAMES = {
+    type(None): "null",
+    list: "array",
+    dict: "object",
+    bool: "boolean",
+    int: "number",
+    float: "number",
+    str: "string",
+}
+
+
 class JsonInspector:
     _DEFAULTS: dict[str, Any] = {
         "maxKeys": 50,
@@ -125,8 +159,9 @@ class JsonInspector:
     # --------------------------------------------------------------- helpers
     @staticmethod
     def _safe_type(x: Any) -> str:
-        if x is None:
-            return "null"
+        name = _JSON_TYPE_NAMES.get(type(x))
+        if name is not None:
+            return name
         if isinstance(x, list):
             return "array"
         if isinstance(x, dict):
@@ -176,20 +211,16 @@ class JsonInspector:
     def _decode_pointer_token(token: str, try_url_decode: bool) -> str:
         if try_url_decode:
             return decode_pointer_token_with_url(str(token))
-        from text_to_json.tools.json_pointer import decode_pointer_token
         return decode_pointer_token(str(token))
 
     @classmethod
     def _parse_json_pointer(
         cls, pointer: str, try_url_decode: bool
     ) -> dict[str, Any]:
-        if pointer == "" or pointer == "/":
-            return {"ok": True, "tokens": []}
-        if not pointer.startswith("/"):
-            pointer = "/" + pointer
-        raw_tokens = pointer.split("/")[1:]
-        tokens = [cls._decode_pointer_token(t, try_url_decode) for t in raw_tokens]
-        return {"ok": True, "tokens": tokens}
+        return {
+            "ok": True,
+            "tokens": _parse_pointer_tokens(pointer, try_url_decode),
+        }
 
     @classmethod
     def _preview_string(cls, s: str, max_len: int) -> str:
@@ -254,10 +285,12 @@ class JsonInspector:
 
         # object
         obj = value
-        keys = list(obj.keys()) if isinstance(obj, dict) else []
-        count = len(keys)
+        # Only the first maxKeys keys are previewed — take them via islice
+        # instead of materializing every key, which on very large
+        # documents (100k+ keys) allocated a throwaway list per inspect.
+        count = len(obj) if isinstance(obj, dict) else 0
         take = min(count, opts["maxKeys"])
-        keys_preview = keys[:take]
+        keys_preview = list(islice(obj, take)) if count else []
 
         shallow_preview = None
         if depth < opts["maxDepthPreview"]:
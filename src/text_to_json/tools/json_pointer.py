@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from urllib.parse import unquote
 
+_ESCAPE_RE = re.compile(r"~[01]")
+
 
 def decode_pointer_token(token: str) -> str:
     """Decode a single JSON Pointer token (RFC 6901).
 
     ``~1`` → ``/`` and ``~0`` → ``~``, applied in the correct order.
+    Tokens without ``~`` (the vast majority of JSON keys) are returned
+    as-is; escaped tokens decode in a single regex scan instead of two
+    replace passes each allocating an intermediate string.
     """
-    return token.replace("~1", "/").replace("~0", "~")
+    if "~" not in token:
+        return token
+    return _ESCAPE_RE.sub(
+        lambda m: "/" if m.group() == "~1" else "~", token
+    )
 
 
 def decode_pointer_token_with_url(token: str) -> str:
@@ -26,8 +37,27 @@ def encode_pointer_token(token: str) -> str:
     """Encode a string as a JSON Pointer token (RFC 6901).
 
     ``~`` → ``~0`` and ``/`` → ``~1``, applied in the correct order.
+    Tokens with nothing to escape skip both replace passes.
+    """
+    token = str(token)
+    if "~" not in token and "/" not in token:
+        return token
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+@lru_cache(maxsize=4096)
+def _split_tokens(path: str) -> tuple[str, ...]:
+    """Split a leading-slash pointer into decoded tokens.
+
+    The agent resolves a small working set of pointers over and over
+    (every tool call re-parses the paths the LLM is iterating on), so the
+    decoded token tuples are memoized. Tuples keep cache entries
+    immutable; callers receive a fresh list.
     """
-    return str(token).replace("~", "~0").replace("/", "~1")
+    if "~" not in path:
+        # Common case: no RFC 6901 escapes — no per-token decode needed.
+        return tuple(path.split("/")[1:])
+    return tuple(decode_pointer_token(t) for t in path.split("/")[1:])
 
 
 def parse_json_pointer(path: str) -> list[str]:
@@ -44,7 +74,7 @@ def parse_json_pointer(path: str) -> list[str]:
         raise ValueError(
             f'Invalid JSON Pointer (must start with "/"): {path}'
         )
-    return [decode_pointer_token(t) for t in path.split("/")[1:]]
+    return list(_split_tokens(path))
 
 
 def parse_json_pointer_lenient(path: str) -> list[str]:
@@ -58,7 +88,7 @@ def parse_json_pointer_lenient(path: str) -> list[str]:
         return []
     if not path.startswith("/"):
         path = "/" + path
-    return [decode_pointer_token(t) for t in path.split("/")[1:]]
+    return list(_split_tokens(path))
 
 
 def join_pointer(base: str, token: str) -> str:
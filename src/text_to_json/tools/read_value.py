@@ -6,6 +6,38 @@ from typing import Any, Optional
 
 from text_to_json.tools.json_pointer import parse_json_pointer_lenient
 
+# Exact-type → JSON type name dispatch for the common case; the sanitize
+# walk classifies every node, so one dict lookup beats an isinstance
+# ladder. Subclasses fall back to the ladder.
+_JSON_TYPE_NAMES = {
+    type(None): "null",
+    list: "array",
+    dict: "object",
+    bool: "boolean",
+    int: "number",
+    float: "number",
+    str: "string",
+}
+
+
+class _Limits:
+    """Truncation limits captured once per read (cheaper than re-reading a
+    dict per node in the sanitize walk)."""
+
+    __slots__ = ("max_string_length", "max_depth", "max_array_items", "max_object_keys")
+
+    def __init__(
+        self,
+        max_string_length: int,
+        max_depth: int,
+        max_array_items: int,
+        max_object_keys: int,
+    ) -> None:
+        self.max_string_length = max_string_length
+        self.max_depth = max_depth
+        self.max_array_items = max_array_items
+        self.max_object_keys = max_object_keys
+
 
 class ReadValue:
     _DEFAULTS = {
@@ -94,7 +126,7 @@ class ReadValue:
         return cls._build_found_result(cur, path, opts)
 
     @classmethod
-    def _read_options(cls, input_data: dict[str, Any]) -> dict[str, Any]:
+    def _read_options(cls, input_data: dict[str, Any]) -> _Limits:
         d = cls._DEFAULTS
 
         def _get_finite_int(key: str, default: int) -> int:
@@ -103,23 +135,22 @@ class ReadValue:
                 return max(0, int(v))
             return default
 
-        return {
-            "max_string_length": _get_finite_int("max_string_length", d["max_string_length"]),
-            "max_depth": _get_finite_int("max_depth", d["max_depth"]),
-            "max_array_items": _get_finite_int("max_array_items", d["max_array_items"]),
-            "max_object_keys": _get_finite_int("max_object_keys", d["max_object_keys"]),
-        }
+        return _Limits(
+            max_string_length=_get_finite_int("max_string_length", d["max_string_length"]),
+            max_depth=_get_finite_int("max_depth", d["max_depth"]),
+            max_array_items=_get_finite_int("max_array_items", d["max_array_items"]),
+            max_object_keys=_get_finite_int("max_object_keys", d["max_object_keys"]),
+        )
 
     @classmethod
     def _build_found_result(
         cls,
         value: Any,
         path: str,
-        opts: dict[str, Any],
+        opts: _Limits,
     ) -> dict[str, Any]:
         value_type = cls._describe_type(value)
-        seen: set[int] = set()
-        sanitized = cls._sanitize_for_json(value, opts, seen, 0)
+        sanitized = cls._sanitize_for_json(value, opts)
 
         return {
             "found": True,
@@ -130,10 +161,10 @@ class ReadValue:
             "notes": sanitized["notes"],
             "stats": sanitized["stats"],
             "limits": {
-                "max_string_length": opts["max_string_length"],
-                "max_depth": opts["max_depth"],
-                "max_array_items": opts["max_array_items"],
-                "max_object_keys": opts["max_object_keys"],
+                "max_string_length": opts.max_string_length,
+                "max_depth": opts.max_depth,
+                "max_array_items": opts.max_array_items,
+                "max_object_keys": opts.max_object_keys,
             },
         }
 
@@ -141,8 +172,10 @@ class ReadValue:
 
     @staticmethod
     def _describe_type(v: Any) -> str:
-        if v is None:
-            return "null"
+        name = _JSON_TYPE_NAMES.get(type(v))
+        if name is not None:
+            return name
+        # Subclasses of the JSON types still classify correctly.
         if isinstance(v, list):
             return "array"
         if isinstance(v, dict):
@@ -173,16 +206,9 @@ class ReadValue:
         return {"ok": True, "index": int(tok)}
 
     @classmethod
-    def _sanitize_for_json(
-        cls,
-        value: Any,
-        opts: dict[str, Any],
-        seen: set[int],
-        depth: int,
-    ) -> dict[str, Any]:
+    def _sanitize_leaf(cls, value: Any, opts: _Limits) -> dict[str, Any]:
+        """Sanitize a non-container value (null, string, number, other)."""
         vtype = cls._describe_type(value)
-        truncated = False
-        notes: list[str] = []
 
         # null
         if value is None:
@@ -195,15 +221,13 @@ class ReadValue:
 
         # string
         if isinstance(value, str):
-            if len(value) > opts["max_string_length"]:
-                truncated = True
-                notes.append(
-                    f"String truncated to max_string_length={opts['max_string_length']}"
-                )
+            if len(value) > opts.max_string_length:
                 return {
-                    "jsonValue": value[: opts["max_string_length"]] + "\u2026",
-                    "truncated": truncated,
-                    "notes": notes,
+                    "jsonValue": value[: opts.max_string_length] + "\u2026",
+                    "truncated": True,
+                    "notes": [
+                        f"String truncated to max_string_length={opts.max_string_length}"
+                    ],
                     "stats": {"type": vtype, "originalLength": len(value)},
                 }
             return {
@@ -223,122 +247,180 @@ class ReadValue:
             }
 
         # Non-container types shouldn't appear in JSON but handle gracefully
-        if not isinstance(value, (dict, list)):
-            notes.append(f"Value was {vtype}; encoded as string for JSON compatibility")
-            try:
-                repr_str = str(value)
-            except Exception:
-                repr_str = f"[{vtype}]"
-            if len(repr_str) > opts["max_string_length"]:
-                truncated = True
-                repr_str = repr_str[: opts["max_string_length"]] + "\u2026"
-                notes.append(
-                    f"Representation truncated to max_string_length={opts['max_string_length']}"
-                )
-            return {
-                "jsonValue": repr_str,
-                "truncated": truncated,
-                "notes": notes,
-                "stats": {"type": vtype},
-            }
+        truncated = False
+        notes = [f"Value was {vtype}; encoded as string for JSON compatibility"]
+        try:
+            repr_str = str(value)
+        except Exception:
+            repr_str = f"[{vtype}]"
+        if len(repr_str) > opts.max_string_length:
+            truncated = True
+            repr_str = repr_str[: opts.max_string_length] + "\u2026"
+            notes.append(
+                f"Representation truncated to max_string_length={opts.max_string_length}"
+            )
+        return {
+            "jsonValue": repr_str,
+            "truncated": truncated,
+            "notes": notes,
+            "stats": {"type": vtype},
+        }
+
+    @classmethod
+    def _open_container(
+        cls, value: Any, opts: _Limits, seen: set[int], depth: int
+    ) -> dict[str, Any]:
+        """Start sanitizing a dict/list node.
+
+        Returns either a finished result dict (circular ref / max depth)
+        or an open frame for the iterative walk (no ``jsonValue`` key yet).
+        """
+        vtype = cls._describe_type(value)
 
         obj_id = id(value)
         if obj_id in seen:
-            notes.append("Circular reference replaced with '[Circular]'")
             return {
                 "jsonValue": "[Circular]",
                 "truncated": True,
-                "notes": notes,
+                "notes": ["Circular reference replaced with '[Circular]'"],
                 "stats": {"type": vtype},
             }
         seen.add(obj_id)
 
-        # Max depth
-        if depth >= opts["max_depth"]:
-            notes.append(
-                f"Max depth reached (max_depth={opts['max_depth']}); "
-                f"replaced with '[MaxDepth]'"
-            )
+        if depth >= opts.max_depth:
             return {
                 "jsonValue": "[MaxDepth]",
                 "truncated": True,
-                "notes": notes,
+                "notes": [
+                    f"Max depth reached (max_depth={opts.max_depth}); "
+                    f"replaced with '[MaxDepth]'"
+                ],
                 "stats": {"type": vtype},
             }
 
-        # array
         if isinstance(value, list):
-            original_length = len(value)
-            limit = opts["max_array_items"]
-            out = []
-            take = min(original_length, limit)
-            nested_changed = False
-
-            for i in range(take):
-                child = cls._sanitize_for_json(value[i], opts, seen, depth + 1)
-                if child["truncated"] or (child["notes"] and len(child["notes"]) > 0):
-                    nested_changed = True
-                if child["truncated"]:
-                    truncated = True
-                out.append(child["jsonValue"])
-
-            if original_length > limit:
-                truncated = True
-                notes.append(f"Array truncated to max_array_items={limit}")
-            if nested_changed:
-                notes.append(
-                    "Nested values were sanitized/truncated for JSON safety"
-                )
-                truncated = True
+            original = len(value)
+            limit = opts.max_array_items
+            take = min(original, limit)
+            items: list[tuple[Any, Any]] = [(i, value[i]) for i in range(take)]
+            out: Any = []
+        else:
+            keys = list(value.keys())
+            original = len(keys)
+            limit = opts.max_object_keys
+            take = min(original, limit)
+            items = [(k, value[k]) for k in keys[:take]]
+            out = {}
 
-            return {
-                "jsonValue": out,
-                "truncated": truncated,
-                "notes": notes,
-                "stats": {
-                    "type": vtype,
-                    "originalLength": original_length,
-                    "returnedLength": len(out),
-                },
-            }
+        return {
+            "vtype": vtype,
+            "is_list": isinstance(value, list),
+            "original": original,
+            "limit": limit,
+            "take": take,
+            "items": items,
+            "idx": 0,
+            "out": out,
+            "truncated": False,
+            "notes": [],
+            "nested_changed": False,
+            "depth": depth,
+            "parent_key": None,
+        }
+
+    @staticmethod
+    def _absorb_child(frame: dict[str, Any], key: Any, child: dict[str, Any]) -> None:
+        """Fold a finished child result into its parent frame."""
+        if child["truncated"] or child["notes"]:
+            frame["nested_changed"] = True
+        if child["truncated"]:
+            frame["truncated"] = True
+        if frame["is_list"]:
+            frame["out"].append(child["jsonValue"])
+        else:
+            frame["out"][key] = child["jsonValue"]
+
+    @staticmethod
+    def _close_container(frame: dict[str, Any]) -> dict[str, Any]:
+        """Finalize an exhausted frame into a result dict."""
+        truncated = frame["truncated"]
+        notes = frame["notes"]
 
-        # object (dict)
-        keys = list(value.keys())
-        original_key_count = len(keys)
-        limit = opts["max_object_keys"]
-        out_dict: dict[str, Any] = {}
-        take = min(original_key_count, limit)
-        nested_changed = False
-
-        for i in range(take):
-            k = keys[i]
-            child = cls._sanitize_for_json(value[k], opts, seen, depth + 1)
-            if child["truncated"] or (child["notes"] and len(child["notes"]) > 0):
-                nested_changed = True
-            if child["truncated"]:
-                truncated = True
-            out_dict[k] = child["jsonValue"]
-
-        if original_key_count > limit:
+        if frame["original"] > frame["limit"]:
             truncated = True
-            notes.append(f"Object truncated to max_object_keys={limit}")
-        if nested_changed:
+            if frame["is_list"]:
+                notes.append(f"Array truncated to max_array_items={frame['limit']}")
+            else:
+                notes.append(f"Object truncated to max_object_keys={frame['limit']}")
+        if frame["nested_changed"]:
             notes.append(
                 "Nested values were sanitized/truncated for JSON safety"
             )
             truncated = True
 
+        if frame["is_list"]:
+            stats = {
+                "type": frame["vtype"],
+                "originalLength": frame["original"],
+                "returnedLength": len(frame["out"]),
+            }
+        else:
+            stats = {
+                "type": frame["vtype"],
+                "originalKeyCount": frame["original"],
+                "returnedKeyCount": frame["take"],
+            }
+
         return {
-            "jsonValue": out_dict,
+            "jsonValue": frame["out"],
             "truncated": truncated,
             "notes": notes,
-            "stats": {
-                "type": vtype,
-                "originalKeyCount": original_key_count,
-                "returnedKeyCount": take,
-            },
+            "stats": stats,
         }
 
+    @classmethod
+    def _sanitize_for_json(cls, value: Any, opts: _Limits) -> dict[str, Any]:
+        """Sanitize/truncate a value for a JSON-safe tool response.
+
+        Iterative explicit-stack walk instead of recursion: the sanitize
+        pass runs on every ``read_value`` response, and on deep documents
+        the per-node Python frame setup of the recursive version dominated.
+        """
+        if not isinstance(value, (dict, list)):
+            return cls._sanitize_leaf(value, opts)
+
+        seen: set[int] = set()
+        root = cls._open_container(value, opts, seen, 0)
+        if "jsonValue" in root:
+            return root
+
+        stack = [root]
+        while True:
+            frame = stack[-1]
+            items = frame["items"]
+            if frame["idx"] < len(items):
+                key, child = items[frame["idx"]]
+                frame["idx"] += 1
+                if isinstance(child, (dict, list)):
+                    sub = cls._open_container(
+                        child, opts, seen, frame["depth"] + 1
+                    )
+                    if "jsonValue" in sub:
+                        cls._absorb_child(frame, key, sub)
+                    else:
+                        sub["parent_key"] = key
+                        stack.append(sub)
+                else:
+                    cls._absorb_child(frame, key, cls._sanitize_leaf(child, opts))
+                continue
+
+            # Frame exhausted \u2014 finalize and fold into the parent.
+            done = cls._close_container(frame)
+            stack.pop()
+            if not stack:
+                return done
+            cls._absorb_child(stack[-1], frame["parent_key"], done)
+
 
 def read_value(
     document: dict[str, Any],
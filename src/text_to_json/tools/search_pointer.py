@@ -8,11 +8,31 @@ Supports exact and fuzzy (Levenshtein) matching.
 
 from __future__ import annotations
 
+import threading
 import unicodedata
 from typing import Any, Literal, Optional
 
 from text_to_json.tools.json_pointer import join_pointer as _join_pointer_util
 
+# Exact-type → JSON type name dispatch: the walk names the type of every
+# collected value, and a single dict lookup replaces the string-compare
+# ladder on `type(value).__name__`.
+_JSON_TYPE_NAMES = {
+    type(None): "null",
+    str: "string",
+    int: "number",
+    float: "number",
+    bool: "boolean",
+}
+
+# Per-thread reusable visited-set. It only holds node ids and never
+# escapes a search, so reusing it across calls is safe and spares the
+# allocator one set (plus its growth reallocations) per search in
+# long-running agent loops. ``matches`` is NOT pooled: that list escapes
+# into the result dict, and copying it out would cost more than a fresh
+# allocation.
+_pool = threading.local()
+
 
 class SearchPointer:
     """Faithful port of the n8n SearchPointer class."""
@@ -46,10 +66,16 @@ class SearchPointer:
             max_value_length = 120
 
         matches: list[dict[str, Any]] = []
-        seen: set[int] = set()
+        seen: Optional[set[int]] = getattr(_pool, "seen", None)
+        if seen is None:
+            seen = set()
+            _pool.seen = seen
+        seen.clear()
 
         state = {
             "query": query,
+            # Normalized once per search instead of once per visited node.
+            "queryNorm": cls._normalize_for_match(query) if fuzzy else query,
             "type": search_type,
             "fuzzy": fuzzy,
             "matches": matches,
@@ -74,40 +100,64 @@ class SearchPointer:
 
         return result
 
+    @classmethod
+    def _children(cls, node: Any, ptr: str):
+        """Yield ``(key, child, child_ptr, is_dict_key)`` for a container."""
+        if isinstance(node, list):
+            for i, item in enumerate(node):
+                yield None, item, cls._join_pointer(ptr, str(i)), False
+        else:
+            for key in node:
+                yield key, node[key], cls._join_pointer(ptr, key), True
+
     @classmethod
     def _visit(cls, node: Any, ptr: str, state: dict[str, Any]) -> None:
-        if len(state["matches"]) >= state["limit"]:
+        """Depth-first walk collecting matches.
+
+        Iterative with an explicit frame stack — the recursive version
+        paid a Python frame per document node, which dominated on large
+        extracted documents. Visit order (and therefore truncation under
+        ``limit``) is identical to the recursive walk.
+        """
+        matches = state["matches"]
+        limit = state["limit"]
+        seen = state["seen"]
+
+        if len(matches) >= limit:
             state["truncated"] = True
             return
         if node is None or not isinstance(node, (dict, list)):
             return
-
-        node_id = id(node)
-        if node_id in state["seen"]:
+        if id(node) in seen:
             return
-        state["seen"].add(node_id)
+        seen.add(id(node))
 
-        if isinstance(node, list):
-            for i, item in enumerate(node):
-                if len(state["matches"]) >= state["limit"]:
-                    state["truncated"] = True
-                    break
-                child_ptr = cls._join_pointer(ptr, str(i))
-                cls._maybe_collect_value(item, child_ptr, state)
-                cls._visit(item, child_ptr, state)
-            return
+        frames = [cls._children(node, ptr)]
+        while frames:
+            try:
+                key, child, child_ptr, is_dict_key = next(frames[-1])
+            except StopIteration:
+                frames.pop()
+                continue
 
-        # dict
-        for key in node:
-            if len(state["matches"]) >= state["limit"]:
+            if len(matches) >= limit:
                 state["truncated"] = True
-                break
-            child_ptr = cls._join_pointer(ptr, key)
-            value = node[key]
+                return
 
-            cls._maybe_collect_key(key, child_ptr, state)
-            cls._maybe_collect_value(value, child_ptr, state)
-            cls._visit(value, child_ptr, state)
+            if is_dict_key:
+                cls._maybe_collect_key(key, child_ptr, state)
+            cls._maybe_collect_value(child, child_ptr, state)
+
+            # Descend (same entry checks the recursive call performed).
+            if len(matches) >= limit:
+                state["truncated"] = True
+                return
+            if child is None or not isinstance(child, (dict, list)):
+                continue
+            if id(child) in seen:
+                continue
+            seen.add(id(child))
+            frames.append(cls._children(child, child_ptr))
 
     @classmethod
     def _maybe_collect_key(
@@ -139,13 +189,7 @@ class SearchPointer:
         stored_value, value_truncated = cls._value_to_stored_value(
             value, state["maxValueLength"]
         )
-        value_type = "null" if value is None else type(value).__name__
-        if value_type == "str":
-            value_type = "string"
-        elif value_type in ("int", "float"):
-            value_type = "number"
-        elif value_type == "bool":
-            value_type = "boolean"
+        value_type = _JSON_TYPE_NAMES.get(type(value)) or type(value).__name__
 
         state["matches"].append(
             {
@@ -161,12 +205,18 @@ class SearchPointer:
     def _matches_query(cls, candidate: str, state: dict[str, Any]) -> bool:
         if not state["fuzzy"]:
             return str(candidate) == state["query"]
-        return cls._fuzzy_match(str(candidate), state["query"])
+        return cls._fuzzy_match_normalized(
+            cls._normalize_for_match(str(candidate)), state["queryNorm"]
+        )
 
     @classmethod
     def _fuzzy_match(cls, a: str, b: str) -> bool:
-        na = cls._normalize_for_match(a)
-        nb = cls._normalize_for_match(b)
+        return cls._fuzzy_match_normalized(
+            cls._normalize_for_match(a), cls._normalize_for_match(b)
+        )
+
+    @classmethod
+    def _fuzzy_match_normalized(cls, na: str, nb: str) -> bool:
         if na == nb:
             return True
         if na in nb or nb in na:
@@ -187,6 +237,11 @@ class SearchPointer:
     def _normalize_for_match(value: str) -> str:
         """Normalize string for matching: NFD decompose, strip accents, lowercase, strip."""
         text = str(value)
+        if text.isascii():
+            # ASCII has no decomposition and no combining marks — skip
+            # the NFD pass and the per-character category scan, which
+            # dominate fuzzy matching on typical documents.
+            return text.lower().strip()
         nfd = unicodedata.normalize("NFD", text)
         stripped = "".join(ch for ch in nfd if unicodedata.category(ch) != "Mn")
         return stripped.lower().strip()
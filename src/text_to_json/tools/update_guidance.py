@@ -1,8 +1,53 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 
+@lru_cache(maxsize=128)
+def _cached_guidance(
+    last_path: str,
+    sections_snapshot: str,
+    items_added: str,
+    open_section: str,
+    text_excerpt: str,
+    next_expectations: str,
+    pending_data: str,
+    extracted_entities_count: int,
+) -> dict[str, Any]:
+    """Build the guidance payload, memoized per argument combination.
+
+    Agent loops re-issue identical update_guidance calls on retries and
+    no-op turns; all arguments are hashable strings/ints, so repeats hit
+    the cache instead of rebuilding the dict. Callers receive copies —
+    the cached dict itself must never escape.
+    """
+    return {
+        "last_path": last_path,
+        "sections_snapshot": sections_snapshot,
+        "items_added": items_added,
+        "open_section": open_section,
+        "text_excerpt": text_excerpt,
+        "next_expectations": next_expectations,
+        "pending_data": pending_data,
+        "extracted_entities_count": extracted_entities_count,
+    }
+
+
+# Pre-built payload for the all-defaults call, which agent loops can hit
+# repeatedly. Returned only as a copy.
+_DEFAULT_GUIDANCE: dict[str, Any] = {
+    "last_path": "",
+    "sections_snapshot": "",
+    "items_added": "",
+    "open_section": "",
+    "text_excerpt": "",
+    "next_expectations": "",
+    "pending_data": "",
+    "extracted_entities_count": 0,
+}
+
+
 def update_guidance(
     last_path: str = "",
     sections_snapshot: str = "",
@@ -39,16 +84,34 @@ def update_guidance(
     Returns:
         The new guidance object to be passed to the next chunk.
     """
+    if not (
+        last_path
+        or sections_snapshot
+        or items_added
+        or open_section
+        or text_excerpt
+        or next_expectations
+        or pending_data
+        or extracted_entities_count
+    ):
+        # All-defaults call: skip hashing eight arguments through the
+        # cache and copy the prebuilt payload directly.
+        return {"finalized": True, "guidance": dict(_DEFAULT_GUIDANCE)}
+
     return {
         "finalized": True,
-        "guidance": {
-            "last_path": last_path,
-            "sections_snapshot": sections_snapshot,
-            "items_added": items_added,
-            "open_section": open_section,
-            "text_excerpt": text_excerpt,
-            "next_expectations": next_expectations,
-            "pending_data": pending_data,
-            "extracted_entities_count": extracted_entities_count,
-        },
+        # Shallow copy: the guidance dict is stored in graph state, so
+        # the cached instance stays private to the cache.
+        "guidance": dict(
+            _cached_guidance(
+                last_path,
+                sections_snapshot,
+                items_added,
+                open_section,
+                text_excerpt,
+                next_expectations,
+                pending_data,
+                extracted_entities_count,
+            )
+        ),
     }
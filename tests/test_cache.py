@@ -0,0 +1,74 @@
+"""Tests for cache.py — extraction result cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from text_to_json.cache import (
+    clear_result_cache,
+    get_cached_result,
+    result_cache_key,
+    store_result,
+)
+from text_to_json.settings import reset_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the cache at a throwaway SQLite file."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("SQLITE_DB_PATH", str(tmp_path / "cache.db"))
+    reset_settings_cache()
+    yield
+    reset_settings_cache()
+
+
+class TestResultCacheKey:
+
+    def test_stable_for_same_inputs(self):
+        key1 = result_cache_key("some text", {"type": "object"}, "openai:gpt-4o-mini")
+        key2 = result_cache_key("some text", {"type": "object"}, "openai:gpt-4o-mini")
+        assert key1 == key2
+
+    def test_varies_with_text_schema_and_model(self):
+        base = result_cache_key("text", {"a": 1}, "m1")
+        assert result_cache_key("other", {"a": 1}, "m1") != base
+        assert result_cache_key("text", {"a": 2}, "m1") != base
+        assert result_cache_key("text", {"a": 1}, "m2") != base
+
+    def test_schema_key_order_does_not_matter(self):
+        key1 = result_cache_key("text", {"a": 1, "b": 2}, "m")
+        key2 = result_cache_key("text", {"b": 2, "a": 1}, "m")
+        assert key1 == key2
+
+    def test_none_schema(self):
+        key = result_cache_key("text", None, "m")
+        assert key != result_cache_key("text", {}, "m")
+
+
+class TestResultStore:
+
+    def test_miss_returns_none(self):
+        assert get_cached_result("no-such-key") is None
+
+    def test_roundtrip(self):
+        result = {"json_document": {"a": 1}, "metadata": {}, "error": None}
+        store_result("k1", result)
+        assert get_cached_result("k1") == result
+
+    def test_hit_returns_fresh_copy(self):
+        result = {"json_document": {"a": 1}, "metadata": {}, "error": None}
+        store_result("k1", result)
+        first = get_cached_result("k1")
+        first["json_document"]["a"] = 999
+        assert get_cached_result("k1")["json_document"]["a"] == 1
+
+    def test_overwrite(self):
+        store_result("k1", {"json_document": {"v": 1}})
+        store_result("k1", {"json_document": {"v": 2}})
+        assert get_cached_result("k1")["json_document"]["v"] == 2
+
+    def test_clear(self):
+        store_result("k1", {"json_document": {}})
+        clear_result_cache()
+        assert get_cached_result("k1") is None
@@ -7,7 +7,12 @@ import pytest
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 
 from text_to_json.agent.nodes import (
+    LLMCache,
     _count_nested_items,
+    _extract_json_payload,
+    _is_error_content,
+    _last_round_tool_contents,
+    _loads_relaxed,
     _pre_validate_patches,
     _resolve_path,
     _trim_messages,
@@ -269,3 +274,111 @@ class TestTrimMessages:
         human = HumanMessage(content="chunk")
         result = _trim_messages([sys, human])
         assert result is None
+
+
+# ======================================================================
+# Relaxed JSON parsing
+# ======================================================================
+class TestLoadsRelaxed:
+
+    def test_strict_json(self):
+        assert _loads_relaxed('{"a": 1}') == {"a": 1}
+        assert _loads_relaxed('[{"op": "add"}]') == [{"op": "add"}]
+
+    def test_stray_prose_around_payload(self):
+        text = 'Here are the patches:\n[{"op": "add", "path": "/x"}]\nDone.'
+        assert _loads_relaxed(text) == [{"op": "add", "path": "/x"}]
+
+    def test_braces_inside_strings_ignored(self):
+        text = 'note {"msg": "uses } and { freely"} trailing'
+        assert _loads_relaxed(text) == {"msg": "uses } and { freely"}
+
+    def test_unrecoverable_raises(self):
+        import orjson
+
+        with pytest.raises(orjson.JSONDecodeError):
+            _loads_relaxed("no json here")
+
+    def test_extract_returns_original_without_container(self):
+        assert _extract_json_payload("plain text") == "plain text"
+
+
+# ======================================================================
+# Stuck-loop detection helpers
+# ======================================================================
+class TestLastRoundToolContents:
+
+    def test_empty(self):
+        assert _last_round_tool_contents([]) == []
+
+    def test_returns_last_consecutive_run(self):
+        messages = [
+            SystemMessage(content="system"),
+            AIMessage(content="", tool_calls=[{"id": "a", "name": "x", "args": {}}]),
+            ToolMessage(content='{"ok":true}', tool_call_id="a"),
+            AIMessage(content="", tool_calls=[{"id": "b", "name": "x", "args": {}}]),
+            ToolMessage(content='{"error": "boom"}', tool_call_id="b"),
+            ToolMessage(content='{"error": "bang"}', tool_call_id="c"),
+        ]
+        assert _last_round_tool_contents(messages) == [
+            '{"error": "boom"}',
+            '{"error": "bang"}',
+        ]
+
+    def test_no_tool_messages(self):
+        messages = [SystemMessage(content="s"), AIMessage(content="hi")]
+        assert _last_round_tool_contents(messages) == []
+
+    def test_is_error_content(self):
+        assert _is_error_content('{"error": "boom"}') is True
+        assert _is_error_content('{"ok":false,"errors":[]}') is True
+        assert _is_error_content('{"ok":true}') is False
+
+
+# ======================================================================
+# LLMCache
+# ======================================================================
+class TestLLMCache:
+
+    def _conversation(self, chunk: str = "chunk 1") -> list:
+        return [SystemMessage(content="system"), HumanMessage(content=chunk)]
+
+    def test_miss_returns_none(self):
+        cache = LLMCache()
+        key = cache.key_for(self._conversation())
+        assert cache.get(key) is None
+
+    def test_hit_after_put(self):
+        cache = LLMCache()
+        key = cache.key_for(self._conversation())
+        response = AIMessage(
+            content="",
+            tool_calls=[{"id": "tc1", "name": "inspect_keys", "args": {}}],
+        )
+        cache.put(key, response)
+        cached = cache.get(key)
+        assert cached is not None
+        assert cached.tool_calls == response.tool_calls
+
+    def test_key_changes_with_content(self):
+        cache = LLMCache()
+        key1 = cache.key_for(self._conversation("chunk 1"))
+        key2 = cache.key_for(self._conversation("chunk 2"))
+        assert key1 != key2
+
+    def test_hit_returns_fresh_copy(self):
+        cache = LLMCache()
+        key = cache.key_for(self._conversation())
+        response = AIMessage(content="", id="original-id")
+        cache.put(key, response)
+        cached = cache.get(key)
+        assert cached is not response
+        assert cached.id != "original-id"
+
+    def test_lru_eviction(self):
+        cache = LLMCache(maxsize=2)
+        keys = [cache.key_for(self._conversation(f"chunk {i}")) for i in range(3)]
+        for key in keys:
+            cache.put(key, AIMessage(content=""))
+        assert cache.get(keys[0]) is None  # evicted
+        assert cache.get(keys[2]) is not None